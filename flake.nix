@@ -28,7 +28,6 @@
           # Core dependencies from pyproject.toml
           typer # CLI framework
           rich # Terminal formatting
-          pydantic # Data validation
           loguru # Modern logging
           pyinstaller # building python package
         ]
@@ -48,7 +47,6 @@
         dependencies = with python.pkgs; [
           typer
           rich
-          pydantic
           loguru
         ];
 
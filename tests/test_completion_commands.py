@@ -0,0 +1,25 @@
+import typer
+from time_helper.cli import app
+from time_helper.cli.completion_commands import generate_completion_script
+
+
+def test_completion_script_inlines_commands_and_tags():
+    """Test that commands, sub-commands and safe tags are inlined."""
+    script = generate_completion_script(
+        "bash", typer.main.get_command(app), ["admin", "dev-ops", "a$(b)"]
+    )
+
+    assert "start stop summary" in script
+    assert 'db) words="clear-cache import-all init path status"' in script
+    assert 'start) words="admin dev-ops"' in script
+    # Hidden aliases and unsafe tags are left out
+    assert " su " not in script
+    assert "$(b)" not in script
+    assert "bashcompinit" not in script
+
+
+def test_completion_script_zsh_enables_bash_completion():
+    """Test that the zsh flavour loads bashcompinit first."""
+    script = generate_completion_script("zsh", typer.main.get_command(app), [])
+
+    assert "autoload -U +X bashcompinit && bashcompinit" in script
@@ -0,0 +1,229 @@
+import json
+from dataclasses import asdict
+import pytest
+from unittest.mock import patch
+from datetime import date
+from time_helper.database import Database
+from time_helper.models import TimeEntry
+
+
+@pytest.fixture
+def temp_db(tmp_path):
+    db_path = tmp_path / "test_time_helper.db"
+    db = Database(str(db_path))
+    return db
+
+
+def _make_entries():
+    return [
+        TimeEntry(
+            id=1,
+            start="20230101T090000Z",
+            end="20230101T100000Z",
+            tags=["work"],
+            date=date(2023, 1, 1),
+        ),
+        TimeEntry(
+            id=2,
+            start="20230102T090000Z",
+            end="20230102T113000Z",
+            tags=["meeting"],
+            annotation="Planning",
+            date=date(2023, 1, 2),
+        ),
+        TimeEntry(
+            id=3,
+            start="20230103T090000Z",
+            end="20230103T100000Z",
+            tags=["work"],
+            date=date(2023, 1, 3),
+        ),
+    ]
+
+
+def test_bulk_store_time_entries(temp_db):
+    stored = temp_db.bulk_store_time_entries(_make_entries())
+
+    assert stored == 3
+    result = temp_db.get_time_entries(date(2023, 1, 1), date(2023, 1, 3))
+    assert [e.id for e in result] == [1, 2, 3]
+    assert result[1].annotation == "Planning"
+    assert result[1].date == date(2023, 1, 2)
+
+
+def test_bulk_store_time_entries_chunks(temp_db):
+    stored = temp_db.bulk_store_time_entries(_make_entries(), chunk_size=2)
+
+    assert stored == 3
+    result = temp_db.get_time_entries(date(2023, 1, 1), date(2023, 1, 3))
+    assert len(result) == 3
+
+
+def test_bulk_store_time_entries_empty(temp_db):
+    assert temp_db.bulk_store_time_entries([]) == 0
+
+
+def test_import_timew_json_matches_python_path(tmp_path):
+    raw = [
+        '{"id":1,"start":"20230101T090000Z","end":"20230101T100000Z",'
+        '"tags":["Work","extra"],"annotation":"Task"}',
+        '{"id":2,"start":"20230102T090000Z","end":"20230102T113000Z"}',
+    ]
+    json_db = Database(str(tmp_path / "json.db"))
+    python_db = Database(str(tmp_path / "python.db"))
+
+    count, skipped, earliest, latest = json_db.import_timew_json(
+        [f"[{raw[0]}]", f"[{raw[1]}]"]
+    )
+    python_db.bulk_store_time_entries(
+        TimeEntry.from_dict(json.loads(r)) for r in raw
+    )
+
+    assert count == 2
+    assert skipped == 0
+    assert earliest <= latest
+    from_json = json_db.get_time_entries(date(2000, 1, 1), date(2100, 1, 1))
+    from_python = python_db.get_time_entries(
+        date(2000, 1, 1), date(2100, 1, 1)
+    )
+    assert [asdict(e) for e in from_json] == [asdict(e) for e in from_python]
+    assert from_json[0].tags == ["work"]
+    assert from_json[1].tags == ["untagged"]
+
+
+def test_import_timew_json_skips_malformed_intervals(temp_db):
+    chunk = (
+        '[{"id":1,"start":"20230101T090000Z","end":"20230101T100000Z"},'
+        '{"id":2,"start":"garbage","end":"20230102T100000Z"},'
+        '{"id":3,"start":"20230103T090000Z","end":"not-a-time"}]'
+    )
+
+    count, skipped, earliest, latest = temp_db.import_timew_json([chunk])
+
+    assert (count, skipped) == (1, 2)
+    assert earliest == latest
+    entries = temp_db.get_time_entries(date(2000, 1, 1), date(2100, 1, 1))
+    assert [entry.id for entry in entries] == [1]
+
+
+def test_failed_import_does_not_leave_staging_table(temp_db):
+    def failing_chunks():
+        yield '[{"id":1,"start":"20230101T090000Z"}]'
+        raise RuntimeError("export interrupted")
+
+    with pytest.raises(RuntimeError):
+        temp_db.import_timew_json(failing_chunks())
+    with pytest.raises(RuntimeError):
+        temp_db.summarize_timew_json(failing_chunks())
+
+    chunk = '[{"id":1,"start":"20230101T090000Z","end":"20230101T100000Z"}]'
+    assert temp_db.import_timew_json([chunk])[:2] == (1, 0)
+    assert temp_db.summarize_timew_json([chunk])["total_entries"] == 1
+
+
+def test_summarize_timew_json(temp_db):
+    chunk = (
+        '[{"id":1,"start":"20230101T120000Z","tags":["Work","x"]},'
+        '{"id":2,"start":"20230102T120000Z","tags":["work"]},'
+        '{"id":3,"start":"20230102T130000Z"}]'
+    )
+
+    summary = temp_db.summarize_timew_json([chunk])
+
+    assert summary["total_entries"] == 3
+    assert summary["days"] == 2
+    assert summary["unique_tags"] == 2
+    assert summary["top_tags"][0] == ("work", 2)
+    # The dry run must not write anything
+    assert temp_db.get_time_entries(date(2000, 1, 1), date(2100, 1, 1)) == []
+
+
+def test_summarize_timew_json_breaks_tag_ties_by_name(temp_db):
+    chunk = (
+        '[{"id":1,"start":"20230101T120000Z","tags":["x"]},'
+        '{"id":2,"start":"20230101T130000Z","tags":["meeting"]},'
+        '{"id":3,"start":"20230101T140000Z","tags":["work"]},'
+        '{"id":4,"start":"20230101T150000Z","tags":["work"]}]'
+    )
+
+    summary = temp_db.summarize_timew_json([chunk])
+
+    assert summary["top_tags"] == [("work", 2), ("meeting", 1), ("x", 1)]
+
+
+def test_schema_initialized_once_per_path(tmp_path):
+    db_path = str(tmp_path / "once.db")
+    Database(db_path)
+
+    with patch.object(Database, "init_db") as mock_init:
+        Database(db_path)
+        mock_init.assert_not_called()
+
+
+def test_schema_recreated_when_file_removed(tmp_path):
+    db_path = tmp_path / "removed.db"
+    Database(str(db_path))
+    db_path.unlink()
+
+    db = Database(str(db_path))
+    assert db.get_time_entries(date(2000, 1, 1), date(2100, 1, 1)) == []
+
+
+def test_connect_applies_pragmas(temp_db):
+    with temp_db.connect() as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+        assert conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+
+
+def test_connection_is_reused(temp_db):
+    conn = temp_db.connect()
+    assert temp_db.connect() is conn
+
+    temp_db.close()
+    assert temp_db.connect() is not conn
+
+
+def test_get_tag_names(temp_db):
+    temp_db.bulk_store_time_entries(_make_entries())
+
+    assert temp_db.get_tag_names() == ["meeting", "work"]
+
+
+def test_iter_time_entries_yields_stored_rows(temp_db):
+    temp_db.bulk_store_time_entries(_make_entries())
+
+    rows = list(
+        temp_db.iter_time_entries(
+            date(2023, 1, 1), date(2023, 1, 3), tags=["work"]
+        )
+    )
+
+    assert [(row.id, row.date, row.hours) for row in rows] == [
+        (1, "2023-01-01", 1.0),
+        (3, "2023-01-03", 1.0),
+    ]
+
+
+def test_get_time_entries_reuses_stored_hours(temp_db):
+    active = TimeEntry(id=4, start="20230103T120000Z", date=date(2023, 1, 3))
+    temp_db.bulk_store_time_entries(_make_entries() + [active])
+
+    result = temp_db.get_time_entries(date(2023, 1, 1), date(2023, 1, 3))
+
+    assert result[1].cached_hours == 2.5
+    assert result[1].get_duration_hours() == 2.5
+    # Active timers are still measured up to now, not the stored value
+    assert result[3].get_duration_hours() > result[3].cached_hours
+
+
+def test_date_range_read_needs_no_sort(temp_db):
+    plan = temp_db.connect().execute(
+        "EXPLAIN QUERY PLAN SELECT * FROM time_entries "
+        "WHERE date BETWEEN ? AND ? ORDER BY date, start_time",
+        ("2023-01-01", "2023-01-07"),
+    )
+    details = [row[3] for row in plan]
+
+    assert any("idx_time_entries_date_start" in d for d in details)
+    assert not any("TEMP B-TREE" in d for d in details)
@@ -88,3 +88,93 @@ def test_get_time_entries_filtering(temp_db):
     # Test 5: Default behavior (no tags specified) - should return all
     result_all = temp_db.get_time_entries(date(2023, 1, 1), date(2023, 1, 2))
     assert len(result_all) == 4
+
+
+def test_get_daily_tag_aggregates(temp_db):
+    entries = [
+        TimeEntry(
+            id=1,
+            start="20230101T090000Z",
+            end="20230101T100000Z",
+            tags=["work"],
+            annotation="Task 1",
+            date=date(2023, 1, 1),
+        ),
+        TimeEntry(
+            id=2,
+            start="20230101T130000Z",
+            end="20230101T143000Z",
+            tags=["work"],
+            annotation="Task 2",
+            date=date(2023, 1, 1),
+        ),
+        TimeEntry(
+            id=3,
+            start="20230102T100000Z",
+            end="20230102T110000Z",
+            tags=["meeting"],
+            date=date(2023, 1, 2),
+        ),
+    ]
+    temp_db.bulk_store_time_entries(entries)
+
+    result = temp_db.get_daily_tag_aggregates(
+        date(2023, 1, 1), date(2023, 1, 2)
+    )
+    assert result == [
+        (date(2023, 1, 1), "work", 2.5, ["Task 1", "Task 2"]),
+        (date(2023, 1, 2), "meeting", 1.0, []),
+    ]
+
+    # Tag filter restricts the totals
+    result_meeting = temp_db.get_daily_tag_aggregates(
+        date(2023, 1, 1), date(2023, 1, 2), tags=["meeting"]
+    )
+    assert [row[1] for row in result_meeting] == ["meeting"]
+
+
+def test_get_daily_tag_aggregates_measures_active_timer(temp_db):
+    # Stored hours of an active timer are stale; it is re-measured to now
+    entry = TimeEntry(id=1, start="20230101T090000Z", date=date(2023, 1, 1))
+    temp_db.bulk_store_time_entries([entry])
+
+    ((_, _, hours, _),) = temp_db.get_daily_tag_aggregates(
+        date(2023, 1, 1), date(2023, 1, 1)
+    )
+    assert hours == pytest.approx(entry.get_duration_hours(), abs=0.01)
+
+
+def test_get_daily_tag_aggregates_orders_annotations_by_start(temp_db):
+    # Inserted out of start order (and with a higher id first)
+    entries = [
+        TimeEntry(
+            id=3,
+            start="20230101T150000Z",
+            end="20230101T160000Z",
+            tags=["work"],
+            annotation="Afternoon",
+            date=date(2023, 1, 1),
+        ),
+        TimeEntry(
+            id=1,
+            start="20230101T080000Z",
+            end="20230101T090000Z",
+            tags=["work"],
+            annotation="Morning",
+            date=date(2023, 1, 1),
+        ),
+        TimeEntry(
+            id=2,
+            start="20230101T120000Z",
+            end="20230101T130000Z",
+            tags=["work"],
+            annotation="Noon",
+            date=date(2023, 1, 1),
+        ),
+    ]
+    temp_db.bulk_store_time_entries(entries)
+
+    ((_, _, _, annotations),) = temp_db.get_daily_tag_aggregates(
+        date(2023, 1, 1), date(2023, 1, 1)
+    )
+    assert annotations == ["Morning", "Noon", "Afternoon"]
@@ -10,7 +10,7 @@ def test_generate_report_markdown_format(mock_report_generator, mock_database):
     db_instance = mock_database.return_value
     report_gen_instance = mock_report_generator.return_value
 
-    db_instance.get_time_entries.return_value = ["fake_entry"]
+    db_instance.get_daily_tag_aggregates.return_value = ["fake_aggregate"]
     report_gen_instance.format_as_markdown.return_value = "# Markdown Report"
 
     start_date = date(2023, 1, 1)
@@ -38,7 +38,7 @@ def test_generate_report_csv_format(mock_report_generator, mock_database):
     db_instance = mock_database.return_value
     report_gen_instance = mock_report_generator.return_value
 
-    db_instance.get_time_entries.return_value = ["fake_entry"]
+    db_instance.get_daily_tag_aggregates.return_value = ["fake_aggregate"]
     report_gen_instance.format_as_csv.return_value = "Date,Tag,Hours"
 
     start_date = date(2023, 1, 1)
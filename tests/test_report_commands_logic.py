@@ -1,6 +1,10 @@
 from unittest.mock import patch
 from datetime import date
-from time_helper.cli.report_commands import generate_report
+from time_helper.cli.report_commands import (
+    _export_days,
+    generate_report,
+    list_weeks,
+)
 
 
 @patch("time_helper.cli.report_commands.Database")
@@ -14,8 +18,8 @@ def test_generate_report_logic_with_filters(
     db_instance = mock_database.return_value
     report_gen_instance = mock_report_generator.return_value
 
-    # Mock db.get_time_entries to return something so we don't trigger export
-    db_instance.get_time_entries.return_value = ["fake_entry"]
+    # Mock cached aggregates so we don't trigger export
+    db_instance.get_daily_tag_aggregates.return_value = ["fake_aggregate"]
 
     start_date = date(2023, 1, 1)
     end_date = date(2023, 1, 3)
@@ -29,11 +33,11 @@ def test_generate_report_logic_with_filters(
     # Verify calls
     # Note: args passed to generate_report are positional or keyword depending on implementation  # noqa: E501
     # We check if called with correct args
-    db_instance.get_time_entries.assert_called_with(
+    db_instance.get_daily_tag_aggregates.assert_called_with(
         start_date, end_date, tags=tags
     )  # noqa: E501
-    report_gen_instance.generate_report.assert_called_with(
-        ["fake_entry"], start_date, end_date, tags=tags
+    report_gen_instance.generate_report_from_aggregates.assert_called_with(
+        ["fake_aggregate"], start_date, end_date, tags=tags
     )  # noqa: E501
     report_gen_instance.print_weekly_report.assert_called()
 
@@ -48,7 +52,7 @@ def test_generate_report_logic_export(
     db_instance = mock_database.return_value
 
     # Mock cache miss
-    db_instance.get_time_entries.return_value = []
+    db_instance.get_daily_tag_aggregates.return_value = []
 
     mock_export.return_value = (
         []
@@ -62,3 +66,28 @@ def test_generate_report_logic_export(
 
     # Verify export was called
     mock_export.assert_called()
+
+
+@patch("time_helper.cli.report_commands._export_day_data")
+def test_export_days_preserves_date_order(mock_export):
+    """Test that concurrent per-day exports are flattened in date order."""
+    mock_export.side_effect = lambda day: [day.day, day.day * 10]
+    days = [date(2023, 1, d) for d in range(1, 8)]
+
+    assert _export_days(days) == [
+        value for d in range(1, 8) for value in (d, d * 10)
+    ]
+    assert mock_export.call_count == 7
+
+
+@patch("time_helper.cli.report_commands.Table")
+@patch("time_helper.cli.report_commands.console")
+def test_list_weeks_steps_back_one_week_per_row(mock_console, mock_table):
+    """Test that list_weeks lists consecutive weeks ending at this week."""
+    list_weeks(count=3)
+
+    rows = [c.args for c in mock_table.return_value.add_row.call_args_list]
+    starts = [date.fromisoformat(row[1][:10]) for row in rows]
+    assert [row[0] for row in rows] == ["0", "-1", "-2"]
+    assert starts[0].weekday() == 0
+    assert [(starts[0] - s).days for s in starts] == [0, 7, 14]
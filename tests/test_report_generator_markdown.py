@@ -99,3 +99,33 @@ def test_format_as_markdown_empty_day():
 
     assert "### Monday (2026-01-12)" in markdown
     assert "*No time tracked*" in markdown
+
+
+def test_sorted_daily_reports_follow_date_range():
+    def daily(day):
+        return DailyReport(date=day, tag_summaries={}, total_hours=0.0)
+
+    reports = {d: daily(d) for d in (date(2026, 1, 14), date(2026, 1, 12))}
+    report = WeeklyReport(
+        week_start=date(2026, 1, 12),
+        daily_reports=reports,
+        weekly_summaries={},
+        total_hours=0.0,
+        end_date=date(2026, 1, 14),
+    )
+
+    assert [d for d, r in report.iter_days() if r is None] == [
+        date(2026, 1, 13)
+    ]
+    assert [r.date for r in report.get_sorted_daily_reports()] == [
+        date(2026, 1, 12),
+        date(2026, 1, 14),
+    ]
+
+    # Reports outside the range are still included, in date order
+    reports[date(2026, 1, 10)] = daily(date(2026, 1, 10))
+    assert [r.date for r in report.get_sorted_daily_reports()] == [
+        date(2026, 1, 10),
+        date(2026, 1, 12),
+        date(2026, 1, 14),
+    ]
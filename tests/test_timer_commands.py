@@ -0,0 +1,142 @@
+from datetime import date, datetime, time, timezone
+from unittest.mock import MagicMock, patch
+from time_helper.cli.timer_commands import (
+    TagCompleter,
+    _find_impacted_entries,
+    _is_impacted,
+    start_timer,
+)
+from time_helper.exceptions import TimewarriorError
+from time_helper.models import TimeEntry
+
+
+def test_tag_completer_matches_case_insensitively():
+    """Test that completions are matched case-insensitively, in order."""
+    completer = TagCompleter(["Work", "admin", "Wiki", "dev"])
+
+    matches = [completer.complete("w", state) for state in range(3)]
+
+    assert matches == ["Wiki", "Work", None]
+
+
+def test_tag_completer_refilters_when_text_changes():
+    """Test that cached matches are not reused for a different prefix."""
+    completer = TagCompleter(["admin", "dev", "devops"])
+
+    assert completer.complete("a", 0) == "admin"
+    assert completer.complete("dev", 1) == "devops"
+    assert completer.complete("x", 0) is None
+
+
+def test_is_impacted_classifies_intervals():
+    """Test which intervals a start time would stop, shorten or overlap."""
+
+    def at(hour, minute=0):
+        return datetime(2024, 1, 15, hour, minute)
+
+    start = at(9)
+
+    # Active timer started after the input time is stopped
+    assert _is_impacted(start, at(10), None)
+    assert not _is_impacted(start, at(8), None)
+    # Closed intervals containing or following the input time
+    assert _is_impacted(start, at(8), at(10))
+    assert _is_impacted(start, at(9, 30), at(10))
+    assert not _is_impacted(start, at(7), at(8))
+
+
+def _entry_today(entry_id, start, end=None):
+    """Build a TimeEntry from local HH:MM times on today's date."""
+
+    def to_utc(value):
+        local = datetime.combine(date.today(), value).astimezone()
+        return local.astimezone(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+    return TimeEntry(
+        id=entry_id,
+        start=to_utc(start),
+        end=to_utc(end) if end else None,
+        tags=["work"],
+    )
+
+
+@patch("time_helper.cli.timer_commands.get_current_entries")
+@patch("time_helper.cli.timer_commands.run_timew_command")
+def test_start_timer_without_overlap_runs_timew_once(mock_run, mock_entries):
+    """Test that a non-overlapping start time needs no probe command."""
+    mock_entries.return_value = [_entry_today(1, time(7, 0), time(8, 0))]
+    mock_run.return_value = MagicMock(stdout="")
+
+    start_timer(["admin", "0900"])
+
+    mock_run.assert_called_once_with(["start", "admin", "09:00"], check=True)
+
+
+@patch("time_helper.cli.timer_commands.typer.confirm", return_value=True)
+@patch("time_helper.cli.timer_commands.get_current_entries")
+@patch("time_helper.cli.timer_commands.run_timew_command")
+def test_start_timer_with_overlap_uses_adjust(
+    mock_run, mock_entries, mock_confirm
+):
+    """Test that a confirmed overlap starts the timer with :adjust."""
+    mock_entries.return_value = [_entry_today(1, time(8, 0), time(10, 0))]
+    mock_run.return_value = MagicMock(stdout="")
+
+    start_timer(["admin", "0900"])
+
+    mock_confirm.assert_called_once()
+    mock_run.assert_called_once_with(
+        ["start", "admin", "09:00", ":adjust"], check=True
+    )
+
+
+@patch("time_helper.cli.timer_commands.get_current_entries")
+@patch("time_helper.cli.timer_commands.run_timew_command")
+def test_start_timer_starts_when_overlap_check_fails(mock_run, mock_entries):
+    """Test that a failing export leaves the overlap check to timew."""
+    mock_entries.side_effect = TimewarriorError("Could not read data")
+    mock_run.return_value = MagicMock(stdout="")
+
+    start_timer(["admin", "0700"])
+
+    mock_run.assert_called_once_with(["start", "admin", "07:00"], check=True)
+
+
+def test_tag_completer_prefix_range_is_exact():
+    """Test that only tags sharing the prefix fall in the matched range."""
+    completer = TagCompleter(["dev", "Deploy", "design", "devops", "docs"])
+
+    matches = [completer.complete("DE", state) for state in range(4)]
+
+    assert matches == ["Deploy", "design", "dev", "devops"]
+    assert completer.complete("dev", 2) is None
+
+
+@patch("time_helper.cli.timer_commands.get_current_entries")
+def test_find_impacted_entries_counts_later_entries(mock_entries):
+    """Test that entries starting after the input time are all counted."""
+    mock_entries.return_value = [
+        _entry_today(i, time(10 + i), time(10 + i, 30)) for i in range(10)
+    ] + [_entry_today(99, time(7, 0), time(8, 0))]
+
+    shown, count = _find_impacted_entries("09:00")
+
+    assert count == 10
+    # The newest impacted entries are listed, newest first
+    assert [e.id for e in shown] == [9, 8, 7, 6, 5, 4, 3, 2]
+
+
+@patch("time_helper.cli.timer_commands.get_current_entries")
+def test_find_impacted_entries_lists_overlapped_entry_last(mock_entries):
+    """Test that an entry cut by the input time follows later entries."""
+    mock_entries.return_value = [
+        _entry_today(1, time(8, 0), time(9, 30)),
+        _entry_today(2, time(10, 0), time(11, 0)),
+        _entry_today(3, time(11, 0)),
+        _entry_today(4, time(7, 0), time(8, 0)),
+    ]
+
+    shown, count = _find_impacted_entries("09:00")
+
+    assert count == 3
+    assert [e.id for e in shown] == [3, 2, 1]
@@ -1,8 +1,18 @@
+import io
 import pytest
 import subprocess
+from datetime import date
 from unittest.mock import patch, MagicMock
-from time_helper.cli.utils import run_timew_command, handle_timew_errors
+from time_helper.cli.utils import (
+    run_timew_command,
+    handle_timew_errors,
+    convert_timespan_format,
+    display_entries,
+    entries_have_meaningful_difference,
+    iter_timew_export_chunks,
+)
 from time_helper.exceptions import TimewarriorError
+from time_helper.models import TimeEntry
 
 
 def test_run_timew_command_success():
@@ -79,3 +89,72 @@ def test_handle_timew_errors_catches_timewarrior_error_unknown():
 
         # Should NOT print unknown errors anymore, as the global handler does it  # noqa: E501
         mock_rprint.assert_not_called()
+
+
+def _mock_popen(stdout, stderr="", returncode=0):
+    proc = MagicMock()
+    proc.__enter__.return_value = proc
+    proc.stdout = io.StringIO(stdout)
+    proc.stderr = io.StringIO(stderr)
+    proc.returncode = returncode
+    return proc
+
+
+def test_iter_timew_export_chunks_rewraps_lines():
+    """Test that exported lines are re-wrapped into bounded JSON arrays."""
+    output = '[\n{"id":2,"start":"a"},\n{"id":1,"start":"b"}\n]\n'
+    with patch("subprocess.Popen", return_value=_mock_popen(output)):
+        chunks = list(iter_timew_export_chunks([":all"], max_chars=1))
+
+    assert chunks == ['[{"id":2,"start":"a"}]', '[{"id":1,"start":"b"}]']
+
+
+def test_iter_timew_export_chunks_raises_on_failure():
+    """Test that a non-zero exit raises TimewarriorError with stderr."""
+    proc = _mock_popen("", stderr="No data\n", returncode=1)
+    with patch("subprocess.Popen", return_value=proc):
+        with pytest.raises(TimewarriorError) as excinfo:
+            list(iter_timew_export_chunks([":all"]))
+
+    assert str(excinfo.value) == "No data"
+
+
+def test_meaningful_difference_ignores_annotation_changes():
+    """Test that only time or ID changes count as meaningful."""
+    before = [TimeEntry(id=1, start="20230101T090000Z", tags=["a"])]
+    retagged = [
+        TimeEntry(id=1, start="20230101T090000Z", tags=["b"], annotation="x")
+    ]
+    moved = [TimeEntry(id=1, start="20230101T080000Z", tags=["a"])]
+
+    assert not entries_have_meaningful_difference(before, retagged)
+    assert entries_have_meaningful_difference(before, moved)
+    assert entries_have_meaningful_difference(before, [])
+
+
+def test_convert_timespan_format_week_offset():
+    """Test that :week-N maps to the Monday-Sunday range N weeks ago."""
+    with patch("time_helper.cli.utils.date") as mock_date:
+        mock_date.today.return_value = date(2024, 1, 17)
+        mock_date.fromordinal = date.fromordinal
+
+        assert convert_timespan_format(":week-1") == "2024-01-08 to 2024-01-14"
+        assert convert_timespan_format(":week-0") == "2024-01-15 to 2024-01-21"
+        assert convert_timespan_format(":week") == ":week"
+
+
+def test_display_entries_prints_once():
+    """Test that all entry lines are written in a single print call."""
+    entries = [
+        TimeEntry(id=2, start="20240115T080000Z", end="20240115T093000Z"),
+        TimeEntry(id=1, start="20240115T100000Z", tags=["dev", "ops"]),
+    ]
+
+    with patch("time_helper.cli.utils.rprint") as mock_print:
+        display_entries(entries, "Entries:")
+
+    mock_print.assert_called_once()
+    lines = mock_print.call_args.args[0].split("\n")
+    assert lines[0] == "Entries:"
+    assert "ID:2" in lines[1] and "(1.50h) \\[no tags]" in lines[1]
+    assert "-Active" in lines[2] and "\\[dev, ops]" in lines[2]
@@ -0,0 +1,46 @@
+from datetime import date
+from unittest.mock import patch
+
+from time_helper.week_utils import WeekUtils
+
+
+@patch("time_helper.week_utils.date", wraps=date)
+def test_get_week_start_date_current_year(mock_date):
+    mock_date.today.return_value = date(2024, 5, 15)  # Wednesday
+
+    assert WeekUtils.get_week_start_date(0, 2024) == date(2024, 5, 13)
+    assert WeekUtils.get_week_start_date(-1, 2024) == date(2024, 5, 6)
+
+
+@patch("time_helper.week_utils.date", wraps=date)
+def test_get_week_start_date_other_year_uses_iso_week(mock_date):
+    mock_date.today.return_value = date(2024, 5, 15)  # ISO week 20
+
+    assert WeekUtils.get_week_start_date(0, 2023) == date(2023, 5, 15)
+    assert WeekUtils.get_week_start_date(-2, 2023) == date(2023, 5, 1)
+
+
+@patch("time_helper.week_utils.date", wraps=date)
+def test_get_week_start_date_steps_back_across_new_year(mock_date):
+    mock_date.today.return_value = date(2026, 1, 12)  # Monday
+
+    starts = [WeekUtils.get_week_start_date(-i, 2026) for i in range(7)]
+    assert starts == [
+        date(2026, 1, 12),
+        date(2026, 1, 5),
+        date(2025, 12, 29),
+        date(2025, 12, 22),
+        date(2025, 12, 15),
+        date(2025, 12, 8),
+        date(2025, 12, 1),
+    ]
+    assert WeekUtils.get_week_start_date(-3) == date(2025, 12, 22)
+
+
+@patch("time_helper.week_utils.date", wraps=date)
+def test_get_week_start_date_other_year_carries_overflow(mock_date):
+    mock_date.today.return_value = date(2024, 5, 15)  # ISO week 20
+
+    # 2023 has 52 ISO weeks, so week 20 + 33 is the first week of 2024
+    assert WeekUtils.get_week_start_date(33, 2023) == date(2024, 1, 1)
+    assert WeekUtils.get_week_start_date(-20, 2023) == date(2022, 12, 26)
@@ -13,6 +13,7 @@ from .summary_commands import display_summary
 from .report_commands import create_report_commands
 from .database_commands import create_database_commands
 from .annotate_commands import undo_annotation, handle_annotate_args
+from .completion_commands import show_completion
 from ..logging_config import setup_logging, get_logger
 from ..exceptions import TimeHelperError
 
@@ -155,6 +156,16 @@ def uan_command() -> None:
     undo_annotation()
 
 
+@app.command("completion")
+def completion_command(
+    shell: str = typer.Argument(
+        "bash", help="Shell to generate the script for: 'bash' or 'zsh'"
+    )
+) -> None:
+    """Print a static completion script, e.g. source <(time-helper completion)."""  # noqa: E501
+    show_completion(shell, typer.main.get_command(app))
+
+
 def main():
     """Main entry point with global error handling."""
     try:
@@ -1,6 +1,5 @@
 """Annotation commands for time-helper application."""
 
-import readline
 import sys
 from typing import Optional
 from rich.console import Console
@@ -22,6 +21,9 @@ def get_user_input(prompt: str) -> str:
         return input(prompt)
 
     try:
+        # Imported here so commands that never prompt don't load readline
+        import readline
+
         # Set up basic readline for proper input handling
         readline.parse_and_bind("tab: complete")
         return input(prompt)
@@ -0,0 +1,106 @@
+"""Static shell completion script generation."""
+
+import re
+from typing import Any, Dict, List
+
+from typer.core import TyperGroup
+
+from ..database import Database
+from ..logging_config import get_logger
+from ..exceptions import TimeHelperError
+
+logger = get_logger(__name__)
+
+# Shells the generated script can be sourced from; zsh uses bash emulation
+SUPPORTED_SHELLS = ("bash", "zsh")
+
+# Tags are inlined as compgen words, so skip any with shell metacharacters
+_SAFE_WORD = re.compile(r"\A[\w.:@+-]+\Z")
+
+_SCRIPT_TEMPLATE = """\
+# time-helper completion, generated by 'time-helper completion {shell}'.
+# Commands and tags are inlined, so completing never starts Python.
+# Regenerate the script to pick up new tags.
+{prelude}_time_helper_complete() {{
+    local cur="${{COMP_WORDS[COMP_CWORD]}}"
+    local words=""
+    if [ "$COMP_CWORD" -eq 1 ]; then
+        words="{commands}"
+    else
+        case "${{COMP_WORDS[1]}}" in
+{cases}
+        esac
+    fi
+    COMPREPLY=($(compgen -W "$words" -- "$cur"))
+}}
+complete -F _time_helper_complete time-helper
+"""
+
+
+def _visible_commands(group: TyperGroup) -> Dict[str, Any]:
+    """Get the non-hidden sub-commands of a click group by name."""
+    return {
+        name: command
+        for name, command in sorted(group.commands.items())
+        if not command.hidden
+    }
+
+
+def generate_completion_script(
+    shell: str, cli_group: TyperGroup, tags: List[str]
+) -> str:
+    """Build a completion script with commands and tags inlined.
+
+    Args:
+        shell: Target shell, one of SUPPORTED_SHELLS
+        cli_group: Root command group of the application
+        tags: Tags to offer after 'start'
+
+    Returns:
+        Shell script text to be sourced by the user's shell
+    """
+    commands = _visible_commands(cli_group)
+    tag_words = " ".join(tag for tag in tags if _SAFE_WORD.match(tag))
+
+    cases = [f'            start) words="{tag_words}" ;;']
+    for name, command in commands.items():
+        if isinstance(command, TyperGroup):
+            sub_commands = " ".join(_visible_commands(command))
+            cases.append(f'            {name}) words="{sub_commands}" ;;')
+
+    prelude = (
+        "autoload -U +X bashcompinit && bashcompinit\n"
+        if shell == "zsh"
+        else ""
+    )
+    return _SCRIPT_TEMPLATE.format(
+        shell=shell,
+        prelude=prelude,
+        commands=" ".join(commands),
+        cases="\n".join(cases),
+    )
+
+
+def show_completion(shell: str, cli_group: TyperGroup) -> None:
+    """Print a static completion script for the given shell.
+
+    Args:
+        shell: Target shell, one of SUPPORTED_SHELLS
+        cli_group: Root command group of the application
+    """
+    logger.debug(f"Generating {shell} completion script")
+
+    if shell not in SUPPORTED_SHELLS:
+        raise TimeHelperError(
+            f"Unsupported shell '{shell}'. Must be one of: {', '.join(SUPPORTED_SHELLS)}"  # noqa: E501
+        )
+
+    try:
+        tags = Database().get_tag_names()
+    except Exception as e:
+        # Commands still complete without a database
+        logger.warning(f"Could not load tags for completion: {e}")
+        tags = []
+
+    # Plain print: the script's [...] subscripts are not Rich markup
+    print(generate_completion_script(shell, cli_group, tags), end="")
@@ -1,122 +1,43 @@
 """Database management commands."""
 
-import json
-import sqlite3
-from datetime import datetime
-from typing import Dict, List
+from typing import Any, Dict
 import typer
 from rich import print as rprint
 
-from .utils import run_timew_command, handle_timew_errors
+from .utils import iter_timew_export_chunks, handle_timew_errors
 from ..database import Database
-from ..models import TimeEntry
 from ..logging_config import get_logger
+from ..exceptions import TimewarriorError
 
 logger = get_logger(__name__)
 
+# PRAGMA auto_vacuum value for INCREMENTAL mode
+INCREMENTAL_AUTO_VACUUM = 2
 
-def _parse_entries_by_date(
-    data: List[dict],
-) -> tuple[Dict[str, List[TimeEntry]], int, str, str]:
-    """Parse timewarrior data and group by date.
+# A full VACUUM only pays off once over a quarter of the pages are free
+VACUUM_FREE_PAGE_RATIO = 4
 
-    Args:
-        data: Raw timewarrior export data
-
-    Returns:
-        Tuple of (entries_by_date, total_entries, earliest_date, latest_date)
-    """
-    logger.debug(f"Parsing {len(data)} entries by date")
-
-    entries_by_date = {}
-    total_entries = 0
-    earliest_date = None
-    latest_date = None
-
-    for entry_data in data:
-        try:
-            entry = TimeEntry.from_dict(entry_data)
-            entry_date = entry.parse_start().date().isoformat()
-
-            if entry_date not in entries_by_date:
-                entries_by_date[entry_date] = []
-            entries_by_date[entry_date].append(entry)
-            total_entries += 1
-
-            # Track date range
-            if earliest_date is None or entry_date < earliest_date:
-                earliest_date = entry_date
-            if latest_date is None or entry_date > latest_date:
-                latest_date = entry_date
-
-        except Exception as e:
-            logger.warning(f"Failed to parse entry: {e}")
-            rprint(f"[yellow]Warning: Failed to parse entry: {e}[/yellow]")
-
-    logger.debug(
-        f"Parsed {total_entries} entries across {len(entries_by_date)} days"
-    )  # noqa: E501
-    return (
-        entries_by_date,
-        total_entries,
-        earliest_date or "",
-        latest_date or "",
-    )  # noqa: E501
-
-
-def _get_tag_counts(
-    entries_by_date: Dict[str, List[TimeEntry]],
-) -> Dict[str, int]:  # noqa: E501
-    """Count occurrences of each tag.
-
-    Args:
-        entries_by_date: Dictionary mapping dates to entry lists
 
-    Returns:
-        Dictionary mapping tags to counts
-    """
-    tag_counts = {}
-
-    for entries in entries_by_date.values():
-        for entry in entries:
-            for tag in entry.tags:
-                tag_counts[tag] = tag_counts.get(tag, 0) + 1
-
-    return tag_counts
-
-
-def _display_dry_run_summary(
-    entries_by_date: Dict[str, List[TimeEntry]],
-    total_entries: int,
-    earliest_date: str,
-    latest_date: str,
-) -> None:
+def _display_dry_run_summary(summary: Dict[str, Any]) -> None:
     """Display summary for dry run.
 
     Args:
-        entries_by_date: Dictionary mapping dates to entry lists
-        total_entries: Total number of entries
-        earliest_date: Earliest date in data
-        latest_date: Latest date in data
+        summary: Aggregates as returned by Database.summarize_timew_json
     """
     rprint("\n[bold blue]Dry Run Summary:[/bold blue]")
-    rprint(f"[green]Total entries to import: {total_entries:,}[/green]")
-    rprint(f"[green]Date range: {earliest_date} to {latest_date}[/green]")
-    rprint(f"[green]Number of days: {len(entries_by_date)}[/green]")
-
-    # Show tag summary
-    tag_counts = _get_tag_counts(entries_by_date)
-    rprint(f"[green]Unique tags: {len(tag_counts)}[/green]")
+    rprint(
+        f"[green]Total entries to import: {summary['total_entries']:,}[/green]"  # noqa: E501
+    )
+    rprint(
+        f"[green]Date range: {summary['earliest_date']} to {summary['latest_date']}[/green]"  # noqa: E501
+    )
+    rprint(f"[green]Number of days: {summary['days']}[/green]")
+    rprint(f"[green]Unique tags: {summary['unique_tags']}[/green]")
 
     # Show top 10 tags
-    if tag_counts:
-        sorted_tags = sorted(
-            tag_counts.items(), key=lambda x: x[1], reverse=True
-        )[  # noqa: E501
-            :10
-        ]  # noqa: E501
+    if summary["top_tags"]:
         rprint("\n[bold blue]Top 10 tags:[/bold blue]")
-        for tag, count in sorted_tags:
+        for tag, count in summary["top_tags"]:
             rprint(f"  {tag}: {count} entries")
 
     rprint(
@@ -138,7 +59,7 @@ def import_all_data(dry_run: bool = False, force: bool = False) -> None:
 
     # Check if database already has data (unless force is used)
     if not force and not dry_run:
-        with sqlite3.connect(db.db_path) as conn:
+        with db.connect() as conn:
             cursor = conn.execute("SELECT COUNT(*) FROM time_entries")
             existing_count = cursor.fetchone()[0]
 
@@ -158,49 +79,57 @@ def import_all_data(dry_run: bool = False, force: bool = False) -> None:
         )
     )
 
-    # Get all data from timewarrior
-    result = run_timew_command(["export", ":all"], check=True)
+    if dry_run:
+        try:
+            summary = db.summarize_timew_json(
+                iter_timew_export_chunks([":all"])
+            )
+        except (TimewarriorError, FileNotFoundError):
+            raise
+        except Exception as e:
+            logger.error(f"Failed to analyze entries: {e}")
+            rprint(f"[red]Error parsing timewarrior data: {e}[/red]")
+            raise typer.Exit(1)
+
+        if not summary["total_entries"]:
+            rprint("[yellow]No data found in timewarrior[/yellow]")
+            return
+
+        rprint(
+            f"[green]Processing {summary['total_entries']} entries...[/green]"
+        )
+        _display_dry_run_summary(summary)
+        return
 
-    # Parse JSON data
+    # Hand the raw export to SQLite, which parses and stores it in bulk
     try:
-        data = json.loads(result.stdout) if result.stdout.strip() else []
-    except json.JSONDecodeError as e:
-        logger.error(f"Failed to parse JSON: {e}")
-        rprint(f"[red]Error parsing timewarrior data: {e}[/red]")
+        (
+            imported_count,
+            skipped_count,
+            earliest_date,
+            latest_date,
+        ) = db.import_timew_json(iter_timew_export_chunks([":all"]))
+        logger.debug(
+            f"Imported {imported_count} entries, skipped {skipped_count}"
+        )
+    except (TimewarriorError, FileNotFoundError):
+        # Leave timewarrior failures to handle_timew_errors
+        raise
+    except Exception as e:
+        logger.error(f"Failed to import entries: {e}")
+        rprint(f"[red]Error importing data: {e}[/red]")
         raise typer.Exit(1)
 
-    if not data:
+    total_entries = imported_count + skipped_count
+    if not total_entries:
         rprint("[yellow]No data found in timewarrior[/yellow]")
         return
 
-    # Parse entries and group by date
-    (
-        entries_by_date,
-        total_entries,
-        earliest_date,
-        latest_date,
-    ) = _parse_entries_by_date(data)
-
-    rprint(f"[green]Processing {len(data)} entries...[/green]")
-
-    if dry_run:
-        _display_dry_run_summary(
-            entries_by_date, total_entries, earliest_date, latest_date
+    if skipped_count:
+        logger.warning(f"Skipped {skipped_count} malformed entries")
+        rprint(
+            f"[yellow]Skipped {skipped_count:,} entries with unparseable start or end times[/yellow]"  # noqa: E501
         )
-        return
-
-    # Store entries in database, grouped by date
-    imported_count = 0
-    for entry_date, entries in entries_by_date.items():
-        try:
-            db.store_time_entries(
-                entries, datetime.fromisoformat(entry_date).date()
-            )  # noqa: E501
-            imported_count += len(entries)
-            logger.debug(f"Imported {len(entries)} entries for {entry_date}")
-        except Exception as e:
-            logger.error(f"Failed to import entries for {entry_date}: {e}")
-            rprint(f"[red]Error importing data for {entry_date}: {e}[/red]")
 
     rprint("\n[bold green]✓ Import complete![/bold green]")
     rprint(
@@ -234,36 +163,37 @@ def database_status() -> None:
     try:
         db = Database()
 
-        # Get basic statistics
-        with sqlite3.connect(db.db_path) as conn:
-            # Total entries
-            cursor = conn.execute("SELECT COUNT(*) FROM time_entries")
-            total_entries = cursor.fetchone()[0]
-
-            # Date range
-            cursor = conn.execute(
-                "SELECT MIN(date), MAX(date) FROM time_entries"
-            )  # noqa: E501
-            date_range = cursor.fetchone()
-
-            # Total hours
-            cursor = conn.execute("SELECT SUM(hours) FROM time_entries")
-            total_hours = cursor.fetchone()[0] or 0
-
-            # Unique tags
-            cursor = conn.execute(
-                "SELECT COUNT(DISTINCT tag) FROM time_entries"
-            )  # noqa: E501
-            unique_tags = cursor.fetchone()[0]
-
-            # Recent activity (last 30 days)
-            cursor = conn.execute(
+        with db.connect() as conn:
+            has_entries = conn.execute(
+                "SELECT EXISTS(SELECT 1 FROM time_entries)"
+            ).fetchone()[0]
+
+            # Get basic statistics in a single pass over the table, but
+            # only when there is something to aggregate
+            total_entries, total_hours = 0, 0
+            if has_entries:
+                (
+                    total_entries,
+                    earliest_date,
+                    latest_date,
+                    total_hours,
+                    unique_tags,
+                    recent_entries,
+                ) = conn.execute(
+                    """
+                    SELECT
+                        COUNT(*),
+                        MIN(date),
+                        MAX(date),
+                        SUM(hours),
+                        COUNT(DISTINCT tag),
+                        SUM(date >= date('now', '-30 days'))
+                    FROM time_entries
                 """
-                SELECT COUNT(*) FROM time_entries
-                WHERE date >= date('now', '-30 days')
-            """
-            )
-            recent_entries = cursor.fetchone()[0]
+                ).fetchone()
+                date_range = (earliest_date, latest_date)
+                total_hours = total_hours or 0
+                recent_entries = recent_entries or 0
 
         rprint("[bold blue]Database Status[/bold blue]")
         rprint(f"[green]Location: {db.db_path}[/green]")
@@ -332,7 +262,8 @@ def clear_cache(table: str = "all") -> None:
             )  # noqa: E501
             return
 
-        with sqlite3.connect(db.db_path) as conn:
+        conn = db.connect()
+        with conn:
             if table == "all" or table == "time_entries":
                 result = conn.execute("DELETE FROM time_entries")
                 entries_deleted = result.rowcount
@@ -347,10 +278,23 @@ def clear_cache(table: str = "all") -> None:
                     f"[green]✓ Cleared {reports_deleted} cached weekly reports[/green]"  # noqa: E501
                 )
 
-        # Vacuum outside of transaction to reclaim space
-        with sqlite3.connect(db.db_path) as conn:
+        # Reclaim space now the transaction is committed, but only when
+        # worth it
+        free_pages = conn.execute("PRAGMA freelist_count").fetchone()[0]
+        total_pages = conn.execute("PRAGMA page_count").fetchone()[0]
+        auto_vacuum = conn.execute("PRAGMA auto_vacuum").fetchone()[0]
+
+        if free_pages and auto_vacuum == INCREMENTAL_AUTO_VACUUM:
+            # executescript steps the pragma until every page is freed
+            conn.executescript("PRAGMA incremental_vacuum;")
+            rprint("[green]✓ Database optimized[/green]")
+        elif free_pages * VACUUM_FREE_PAGE_RATIO > total_pages:
             conn.execute("VACUUM")
             rprint("[green]✓ Database optimized[/green]")
+        else:
+            logger.debug(
+                f"Skipping VACUUM: {free_pages}/{total_pages} pages free"
+            )
 
         if table == "all":
             rprint(
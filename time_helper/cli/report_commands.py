@@ -1,7 +1,8 @@
 """Report generation and export commands."""
 
-from datetime import date, timedelta, datetime
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Tuple
 import typer
 from rich.console import Console
 from rich.table import Table
@@ -17,6 +18,9 @@ from ..logging_config import get_logger
 logger = get_logger(__name__)
 console = Console()
 
+# Upper bound on concurrent 'timew export' subprocesses (one per weekday)
+EXPORT_WORKERS = 7
+
 
 def _determine_target_week(
     date_str: Optional[str], week_offset: int, year: Optional[int]
@@ -36,13 +40,12 @@ def _determine_target_week(
     )
 
     if date_str:
-        target_date = datetime.strptime(date_str, "%Y-%m-%d").date()
+        target_date = date.fromisoformat(date_str)
         logger.debug(f"Using specific date: {target_date}")
     else:
-        week_utils = WeekUtils()
         if year is None:
             year = date.today().year
-        target_date = week_utils.get_week_start_date(week_offset, year)
+        target_date = WeekUtils.get_week_start_date(week_offset, year)
         logger.debug(f"Using calculated date: {target_date}")
 
     return target_date
@@ -75,6 +78,28 @@ def _export_day_data(day_date: date) -> List[TimeEntry]:
     return entries
 
 
+def _export_days(dates: List[date]) -> List[TimeEntry]:
+    """Export timewarrior data for several days concurrently.
+
+    Each day is a separate ``timew export`` subprocess, so the exports are
+    run from a thread pool; results keep the order of ``dates``.
+
+    Args:
+        dates: Dates to export data for
+
+    Returns:
+        List of TimeEntry objects for all dates
+    """
+    if not dates:
+        return []
+
+    workers = min(EXPORT_WORKERS, len(dates))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(_export_day_data, dates))
+
+    return [entry for day_entries in results for entry in day_entries]
+
+
 def _remove_duplicate_entries(entries: List[TimeEntry]) -> List[TimeEntry]:
     """Remove duplicate entries based on ID.
 
@@ -86,13 +111,11 @@ def _remove_duplicate_entries(entries: List[TimeEntry]) -> List[TimeEntry]:
     """
     logger.debug(f"Removing duplicates from {len(entries)} entries")
 
-    seen_ids = set()
-    unique_entries = []
-
+    # Dicts keep insertion order; setdefault keeps the first occurrence
+    by_id: Dict[int, TimeEntry] = {}
     for entry in entries:
-        if entry.id not in seen_ids:
-            unique_entries.append(entry)
-            seen_ids.add(entry.id)
+        by_id.setdefault(entry.id, entry)
+    unique_entries = list(by_id.values())
 
     logger.debug(f"Removed {len(entries) - len(unique_entries)} duplicates")
     return unique_entries
@@ -101,7 +124,7 @@ def _remove_duplicate_entries(entries: List[TimeEntry]) -> List[TimeEntry]:
 def _parse_date_string(date_str: Optional[str]) -> Optional[date]:
     """Parses a date string into a date object."""
     if date_str:
-        return datetime.strptime(date_str, "%Y-%m-%d").date()
+        return date.fromisoformat(date_str)
     return None
 
 
@@ -123,24 +146,19 @@ def export_week(
     )
 
     db = Database()
-    week_utils = WeekUtils()
 
     # Determine the target week
     target_date = _determine_target_week(date_str, week_offset, year)
 
-    week_start = week_utils.get_week_start(target_date)
-    week_dates = week_utils.get_week_dates(week_start)
+    week_start = WeekUtils.get_week_start(target_date)
+    week_dates = WeekUtils.get_week_dates(week_start)
 
     rprint(
         f"[blue]📤 Exporting data for week of {week_start.strftime('%B %d, %Y')}...[/blue]"  # noqa: E501
     )
 
-    all_entries: List[TimeEntry] = []
-
     # Export data for each day of the week
-    for day_date in week_dates:
-        day_entries = _export_day_data(day_date)
-        all_entries.extend(day_entries)
+    all_entries = _export_days(week_dates)
 
     # Remove duplicate entries
     all_entries = _remove_duplicate_entries(all_entries)
@@ -192,7 +210,6 @@ def generate_report(
     )
 
     db = Database()
-    week_utils = WeekUtils()
     report_gen = ReportGenerator()
 
     # Determine report date range
@@ -201,7 +218,7 @@ def generate_report(
     else:
         # Use week logic
         target_date = _determine_target_week(date_str, week_offset, year)
-        report_start = week_utils.get_week_start(target_date)
+        report_start = WeekUtils.get_week_start(target_date)
 
     if end_date:
         report_end = end_date
@@ -215,32 +232,30 @@ def generate_report(
         report_dates.append(curr_date)
         curr_date += timedelta(days=1)
 
-    # Try to load from cache first if enabled
+    # Try to load from cache first if enabled; cached data is summed per
+    # day and tag by SQLite rather than loaded entry by entry
+    aggregates: List[Tuple[date, str, float, List[str]]] = []
     all_entries: List[TimeEntry] = []
 
     if use_cache:
         logger.debug("Attempting to load from cache")
-        cached_entries = db.get_time_entries(
+        aggregates = db.get_daily_tag_aggregates(
             report_start, report_end, tags=tags
-        )  # noqa: E501
-        if cached_entries:
-            all_entries = cached_entries
+        )
+        if aggregates:
             rprint(
                 f"[blue]📋 Using cached data for {report_start.strftime('%Y-%m-%d')} to {report_end.strftime('%Y-%m-%d')}...[/blue]"  # noqa: E501
             )
         else:
             logger.debug("No cached data found")
 
-    if not all_entries:
+    if not aggregates:
         # Export directly from timewarrior
         rprint(
             f"[blue]📤 Exporting data directly from timewarrior for {report_start.strftime('%Y-%m-%d')} to {report_end.strftime('%Y-%m-%d')}...[/blue]"  # noqa: E501
         )
 
-        exported_entries = []
-        for day_date in report_dates:
-            day_entries = _export_day_data(day_date)
-            exported_entries.extend(day_entries)
+        exported_entries = _export_days(report_dates)
 
         if exported_entries:
             rprint("[green]✓ Export complete![/green]\n")
@@ -248,27 +263,16 @@ def generate_report(
         # Remove duplicate entries
         exported_entries = _remove_duplicate_entries(exported_entries)
 
-        # Store in cache by grouping entries by date
+        # Store in cache; each entry is filed under its own date
         if use_cache:
             try:
-                # Group entries by date and store them
-                entries_by_date = {}
-                for entry in exported_entries:
-                    entry_date = entry.date or entry.parse_start().date()
-                    if entry_date not in entries_by_date:
-                        entries_by_date[entry_date] = []
-                    entries_by_date[entry_date].append(entry)
-
-                # Store each day's entries separately
-                for entry_date, day_entries in entries_by_date.items():
-                    db.store_time_entries(day_entries, entry_date)
-
-                logger.info("Stored entries in cache")
+                stored = db.bulk_store_time_entries(exported_entries)
+                logger.info(f"Stored {stored} entries in cache")
 
                 # Now re-fetch from cache to apply filters correctly
-                all_entries = db.get_time_entries(
+                aggregates = db.get_daily_tag_aggregates(
                     report_start, report_end, tags=tags
-                )  # noqa: E501
+                )
 
             except Exception as e:
                 logger.error(f"Failed to cache entries: {e}")
@@ -289,16 +293,21 @@ def generate_report(
                     e for e in all_entries if any(t in tags for t in e.tags)
                 ]  # noqa: E501
 
-    if not all_entries:
+    if not aggregates and not all_entries:
         rprint(
             f"[yellow]No time entries found for {report_start.strftime('%Y-%m-%d')} to {report_end.strftime('%Y-%m-%d')}[/yellow]"  # noqa: E501
         )
         return
 
     # Generate and display the report
-    weekly_report = report_gen.generate_report(
-        all_entries, report_start, report_end, tags=tags
-    )  # noqa: E501
+    if aggregates:
+        weekly_report = report_gen.generate_report_from_aggregates(
+            aggregates, report_start, report_end, tags=tags
+        )
+    else:
+        weekly_report = report_gen.generate_report(
+            all_entries, report_start, report_end, tags=tags
+        )  # noqa: E501
 
     if output_format == "markdown":
         markdown = report_gen.format_as_markdown(weekly_report)
@@ -319,8 +328,9 @@ def list_weeks(count: int = 10) -> None:
     """
     logger.debug(f"Listing {count} weeks")
 
-    week_utils = WeekUtils()
     current_date = date.today()
+    one_week = timedelta(weeks=1)
+    six_days = timedelta(days=6)
 
     table = Table(title="Available Weeks")
     table.add_column("Week Offset", style="cyan")
@@ -328,10 +338,12 @@ def list_weeks(count: int = 10) -> None:
     table.add_column("Week End", style="green")
     table.add_column("Description", style="yellow")
 
+    # Offsets are consecutive, so step back a week at a time from the
+    # current week instead of recomputing each start date
+    week_start = WeekUtils.get_week_start_date(0, current_date.year)
     for i in range(count):
         offset = -i
-        week_start = week_utils.get_week_start_date(offset, current_date.year)
-        week_end = week_start + timedelta(days=6)
+        week_end = week_start + six_days
 
         if i == 0:
             desc = "Current week"
@@ -346,6 +358,7 @@ def list_weeks(count: int = 10) -> None:
             week_end.strftime("%Y-%m-%d (%a)"),
             desc,
         )
+        week_start -= one_week
 
     console.print(table)
 
@@ -1,7 +1,10 @@
 """Summary and display commands for time tracking data."""
 
 from collections import defaultdict
-from typing import List, Optional
+from dataclasses import dataclass
+from datetime import datetime
+from operator import attrgetter
+from typing import Dict, List, NamedTuple, Optional
 import typer
 from rich.console import Console
 from rich.table import Table
@@ -19,6 +22,59 @@ from ..logging_config import get_logger
 logger = get_logger(__name__)
 console = Console()
 
+# Color-coded duration templates, from shortest to longest duration
+_DURATION_TEMPLATES = (
+    "[blue]{:.2f}h[/]",
+    "[yellow]{:.2f}h[/]",
+    "[bold green]{:.2f}h[/]",
+)
+_INDIVIDUAL_DURATION_TEMPLATES = (
+    "[blue]{:.2f}h[/blue]",
+    "[yellow]{:.2f}h[/yellow]",
+    "[bold green]{:.2f}h[/bold green]",
+)
+
+
+class _EntryTimes(NamedTuple):
+    """A TimeEntry with its parsed times and duration looked up once."""
+
+    entry: TimeEntry
+    start: datetime
+    end: Optional[datetime]
+    hours: float
+    tag: str
+
+
+@dataclass
+class _TagTotals:
+    """Per-tag totals accumulated for the summary table."""
+
+    hours: float = 0.0
+    count: int = 0
+    latest_annotation: str = ""
+    latest_start: Optional[datetime] = None
+
+
+def _materialize(entries: List[TimeEntry]) -> List[_EntryTimes]:
+    """Collect start/end times and durations for each entry in one pass.
+
+    Args:
+        entries: List of TimeEntry objects
+
+    Returns:
+        List of _EntryTimes records in the same order as entries
+    """
+    return [
+        _EntryTimes(
+            entry,
+            entry.start_dt,
+            entry.end_dt,
+            entry.get_duration_hours(),
+            entry.get_primary_tag(),
+        )
+        for entry in entries
+    ]
+
 
 def _apply_tag_filter(
     entries: List[TimeEntry], tag_filter: str
@@ -34,10 +90,16 @@ def _apply_tag_filter(
     """
     logger.debug(f"Applying tag filter: {tag_filter}")
 
+    # TimeEntry.__post_init__ lowercases its tags, so only the filter
+    # needs normalizing
+    needle = tag_filter.lower()
     filtered_entries = []
+    keep = filtered_entries.append
     for entry in entries:
-        if any(tag_filter.lower() in tag.lower() for tag in entry.tags):
-            filtered_entries.append(entry)
+        for tag in entry.tags:
+            if needle in tag:
+                keep(entry)
+                break
 
     logger.debug(
         f"Filtered {len(entries)} entries down to {len(filtered_entries)}"
@@ -45,25 +107,30 @@ def _apply_tag_filter(
     return filtered_entries
 
 
-def _create_summary_table(entries: List[TimeEntry]) -> Table:
+def _create_summary_table(records: List[_EntryTimes]) -> Table:
     """Create a summary table for time entries.
 
     Args:
-        entries: List of TimeEntry objects
+        records: Materialized entries as returned by _materialize
 
     Returns:
         Rich Table object
     """
-    logger.debug(f"Creating summary table for {len(entries)} entries")
-
-    # Group entries by tag and calculate totals
-    tag_data = defaultdict(lambda: {"entries": [], "total_hours": 0.0})
-
-    for entry in entries:
-        primary_tag = entry.get_primary_tag()
-        duration = entry.get_duration_hours()
-        tag_data[primary_tag]["entries"].append(entry)
-        tag_data[primary_tag]["total_hours"] += duration
+    logger.debug(f"Creating summary table for {len(records)} entries")
+
+    # Aggregate per tag in one pass
+    tag_data: Dict[str, _TagTotals] = defaultdict(_TagTotals)
+
+    for record in records:
+        totals = tag_data[record.tag]
+        totals.hours += record.hours
+        totals.count += 1
+        annotation = record.entry.annotation
+        if annotation and (
+            totals.latest_start is None or record.start > totals.latest_start
+        ):
+            totals.latest_annotation = annotation
+            totals.latest_start = record.start
 
     # Create summary table
     table = Table(show_header=True, header_style="bold magenta")
@@ -74,50 +141,24 @@ def _create_summary_table(entries: List[TimeEntry]) -> Table:
 
     # Sort tags by total time (descending)
     sorted_tags = sorted(
-        tag_data.items(), key=lambda x: x[1]["total_hours"], reverse=True
+        tag_data.items(), key=lambda item: item[1].hours, reverse=True
     )
 
-    for tag, data in sorted_tags:
-        # Get the latest annotation for this tag
-        latest_annotation = _get_latest_annotation(data["entries"])
-
+    add_row = table.add_row
+    for tag, totals in sorted_tags:
         # Format duration with color coding
-        hours = data["total_hours"]
-        formatted_duration = _format_duration(hours)
+        formatted_duration = _format_duration(totals.hours)
 
-        table.add_row(
+        add_row(
             tag,
             formatted_duration,
-            str(len(data["entries"])),
-            latest_annotation,  # noqa: E501
+            str(totals.count),
+            totals.latest_annotation or "[dim]No annotation[/dim]",
         )
 
     return table
 
 
-def _get_latest_annotation(entries: List[TimeEntry]) -> str:
-    """Get the latest annotation from a list of entries.
-
-    Args:
-        entries: List of TimeEntry objects
-
-    Returns:
-        Latest annotation or placeholder text
-    """
-    latest_annotation = ""
-    latest_time = None
-
-    for entry in entries:
-        entry_time = entry.parse_start()
-        if entry.annotation and (
-            latest_time is None or entry_time > latest_time
-        ):  # noqa: E501
-            latest_annotation = entry.annotation
-            latest_time = entry_time
-
-    return latest_annotation or "[dim]No annotation[/dim]"
-
-
 def _format_duration(hours: float) -> str:
     """Format duration with color coding.
 
@@ -127,24 +168,20 @@ def _format_duration(hours: float) -> str:
     Returns:
         Formatted duration string with color
     """
-    if hours >= 4:
-        return f"[bold green]{hours:.2f}h[/]"  # Long duration
-    elif hours >= 2:
-        return f"[yellow]{hours:.2f}h[/]"  # Medium duration
-    else:
-        return f"[blue]{hours:.2f}h[/]"  # Short duration
+    # Index 0/1/2 = short (<2h), medium (2-4h), long (>=4h)
+    return _DURATION_TEMPLATES[(hours >= 2) + (hours >= 4)].format(hours)
 
 
-def _create_detailed_table(entries: List[TimeEntry]) -> Table:
+def _create_detailed_table(records: List[_EntryTimes]) -> Table:
     """Create a detailed table for time entries.
 
     Args:
-        entries: List of TimeEntry objects (should be sorted by start time)
+        records: Materialized entries (should be sorted by start time)
 
     Returns:
         Rich Table object
     """
-    logger.debug(f"Creating detailed table for {len(entries)} entries")
+    logger.debug(f"Creating detailed table for {len(records)} entries")
 
     detail_table = Table(show_header=True, header_style="bold magenta")
     detail_table.add_column("ID", style="dim", width=6)
@@ -154,16 +191,13 @@ def _create_detailed_table(entries: List[TimeEntry]) -> Table:
     detail_table.add_column("Tags", style="yellow", width=15)
     detail_table.add_column("Annotation", style="white")
 
-    for entry in entries:
-        start_time = entry.parse_start()
-        duration = entry.get_duration_hours()
-
+    add_row = detail_table.add_row
+    for entry, start_time, end_time, duration, _ in records:
         # Format start time
         start_str = start_time.strftime("%H:%M")
 
         # Format end time
-        if entry.end:
-            end_time = entry.parse_end()
+        if end_time:
             end_str = end_time.strftime("%H:%M")
         else:
             end_str = "[red]Active[/red]"
@@ -177,7 +211,7 @@ def _create_detailed_table(entries: List[TimeEntry]) -> Table:
         # Handle annotation
         annotation = entry.annotation or "[dim]—[/dim]"
 
-        detail_table.add_row(
+        add_row(
             str(entry.id),
             start_str,
             end_str,
@@ -198,12 +232,10 @@ def _format_individual_duration(duration: float) -> str:
     Returns:
         Formatted duration string with color
     """
-    if duration >= 2:
-        return f"[bold green]{duration:.2f}h[/bold green]"  # Long duration
-    elif duration >= 1:
-        return f"[yellow]{duration:.2f}h[/yellow]"  # Medium duration
-    else:
-        return f"[blue]{duration:.2f}h[/blue]"  # Short duration
+    # Index 0/1/2 = short (<1h), medium (1-2h), long (>=2h)
+    return _INDIVIDUAL_DURATION_TEMPLATES[
+        (duration >= 1) + (duration >= 2)
+    ].format(duration)
 
 
 @handle_timew_errors
@@ -262,8 +294,11 @@ def _print_summary(
     """
     logger.debug(f"Printing summary for {len(entries)} entries")
 
+    # Parse every entry's times once and reuse them below
+    records = _materialize(entries)
+
     # Calculate total hours
-    total_hours = sum(entry.get_duration_hours() for entry in entries)
+    total_hours = sum(record.hours for record in records)
 
     # Create title
     title_parts = [f"Time Summary for {timespan}"]
@@ -278,15 +313,15 @@ def _print_summary(
     rprint("[bold cyan]Detailed Entries:[/bold cyan]")
 
     # Sort entries by start time
-    sorted_entries = sorted(entries, key=lambda x: x.parse_start())
+    sorted_records = sorted(records, key=attrgetter("start"))
 
     # Create and display detailed table
-    detail_table = _create_detailed_table(sorted_entries)
+    detail_table = _create_detailed_table(sorted_records)
     console.print(detail_table)
 
     # Create and display summary table
     rprint("\n[bold cyan]Summary by Tags:[/bold cyan]")
-    summary_table = _create_summary_table(entries)
+    summary_table = _create_summary_table(records)
     console.print(summary_table)
 
 
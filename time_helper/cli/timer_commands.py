@@ -1,8 +1,9 @@
 """Timer-related commands for starting, stopping, and managing timers."""
 
-import readline
 import sys
-from typing import List, Optional
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, time as Time
+from typing import List, Optional, Tuple
 import typer
 from rich import print as rprint
 
@@ -13,34 +14,45 @@ from .utils import (
     entries_have_meaningful_difference,
     display_entries,
 )
-from ..database import Database
+from ..models import TimeEntry
 from ..logging_config import get_logger
 from ..exceptions import TimewarriorError, TimeHelperError
 
 logger = get_logger(__name__)
 
+# Sorts after any character a tag can continue with, bounding prefix ranges
+_MAX_CHAR = chr(0x10FFFF)
+
+# Impacted entries listed before an overlap confirmation prompt
+MAX_IMPACTED_SHOWN = 8
+
 
 class TagCompleter:
     """Tab completion for tags."""
 
     def __init__(self, tags: List[str]):
-        self.tags = sorted(tags)  # Sort for consistent ordering
+        # Sort case-insensitively so every prefix maps to a contiguous range
+        pairs = sorted((tag.casefold(), tag) for tag in tags)
+        self.tags = [tag for _, tag in pairs]
+        self._folded = [folded for folded, _ in pairs]
+        self._last_text: Optional[str] = None
+        self._matches: List[str] = []
 
     def complete(self, text: str, state: int) -> Optional[str]:
         """Return the next possible completion for 'text'."""
-        # Handle case-insensitive matching
-        text_lower = text.lower()
-
-        # Filter tags that start with the input text (case-insensitive)
-        matches = [
-            tag for tag in self.tags if tag.lower().startswith(text_lower)
-        ]  # noqa: E501
+        # readline calls this with state 0, 1, 2, ... for the same text, so
+        # only look up the matches when the text changes
+        if text != self._last_text:
+            # Binary search the case-folded prefix range
+            key = text.casefold()
+            lo = bisect_left(self._folded, key)
+            hi = bisect_left(self._folded, key + _MAX_CHAR, lo)
+            self._matches = self.tags[lo:hi]
+            self._last_text = text
 
         # Return the state-th match, or None if there aren't enough matches
-        try:
-            return matches[state]
-        except IndexError:
-            return None
+        matches = self._matches
+        return matches[state] if state < len(matches) else None
 
 
 def get_user_input_with_completion(prompt: str, tags: List[str]) -> str:
@@ -50,6 +62,9 @@ def get_user_input_with_completion(prompt: str, tags: List[str]) -> str:
         return input(prompt)
 
     try:
+        # Imported here so commands that never prompt don't load readline
+        import readline
+
         # Set up tab completion
         completer = TagCompleter(tags)
         readline.set_completer(completer.complete)
@@ -68,6 +83,80 @@ def get_user_input_with_completion(prompt: str, tags: List[str]) -> str:
             pass
 
 
+def _is_impacted(
+    input_dt: datetime, entry_start: datetime, entry_end: Optional[datetime]
+) -> bool:
+    """Check whether starting a timer at input_dt would change an entry.
+
+    Args:
+        input_dt: Requested start time
+        entry_start: Start of the entry
+        entry_end: End of the entry, or None for an active timer
+
+    Returns:
+        True if the entry would be stopped, shortened or overlapped
+    """
+    if entry_end is None:
+        # Active timer - would be stopped if input time is before its start
+        return input_dt <= entry_start
+    # Input time falls within the interval, or the entry starts after it
+    return entry_start <= input_dt < entry_end or input_dt < entry_start
+
+
+def _find_impacted_entries(time_arg: str) -> Tuple[List[TimeEntry], int]:
+    """Find today's entries that starting a timer at time_arg would change.
+
+    Args:
+        time_arg: Requested start time in HH:MM format
+
+    Returns:
+        Tuple of (entries to show, total number of impacted entries); the
+        entries shown are the MAX_IMPACTED_SHOWN latest, newest first
+    """
+    try:
+        input_time = Time(int(time_arg[:2]), int(time_arg[3:]))
+    except ValueError as ex:
+        # Leave reporting invalid times to timewarrior
+        logger.debug(f"Cannot check overlaps for {time_arg}: {ex}")
+        return [], 0
+    input_dt = datetime.combine(date.today(), input_time).astimezone()
+
+    current_entries = get_current_entries()
+
+    logger.debug(
+        f"Checking {len(current_entries)} entries for impact with input time {input_time}"  # noqa: E501
+    )
+
+    # Parse every interval once into parallel start/end arrays, ordered by
+    # start, so the sweep below touches only plain datetimes
+    order = sorted(current_entries, key=lambda entry: entry.start_dt)
+    starts = [entry.start_dt for entry in order]
+    ends = [entry.end_dt for entry in order]
+
+    # Every entry starting after the input time is impacted; those are the
+    # newest ones, so they are listed first, newest first
+    split = bisect_right(starts, input_dt)
+    impacted_count = len(order) - split
+    impacted_entries = order[split:][::-1][:MAX_IMPACTED_SHOWN]
+
+    # Earlier entries are impacted only if the input time cuts into them
+    for index in range(split - 1, -1, -1):
+        entry_start, entry_end = starts[index], ends[index]
+        if not _is_impacted(input_dt, entry_start, entry_end):
+            continue
+
+        impacted_count += 1
+        if len(impacted_entries) < MAX_IMPACTED_SHOWN:
+            entry = order[index]
+            logger.debug(
+                f"Entry {entry.id} would be impacted: {entry_start} - {entry_end or 'ongoing'} tags: {entry.tags}"  # noqa: E501
+            )
+            impacted_entries.append(entry)
+
+    logger.debug(f"Found {impacted_count} impacted entries")
+    return impacted_entries, impacted_count
+
+
 @handle_timew_errors
 def start_timer(args: Optional[List[str]] = None) -> None:
     """Start a new timer with optional tags and annotation.
@@ -84,9 +173,10 @@ def start_timer(args: Optional[List[str]] = None) -> None:
 
         # Get available tags for completion
         try:
-            db = Database()
-            tag_data = db.get_all_tags()
-            available_tags = [tag["tag"] for tag in tag_data]
+            # Only the interactive prompt needs the database
+            from ..database import Database
+
+            available_tags = Database().get_tag_names()
         except Exception:
             # Fallback if database is not available
             available_tags = []
@@ -130,129 +220,40 @@ def start_timer(args: Optional[List[str]] = None) -> None:
     # Build timew command - only the tag goes to start command
     cmd_args = ["start", tag]
     if time_arg:
-        # First try without :adjust to detect overlaps
-        test_cmd = cmd_args + [time_arg]
-        logger.debug(f"Testing for overlaps with command: {test_cmd}")
-
+        # Check today's entries for overlaps locally instead of probing
+        # timewarrior with a start command that may fail
         try:
-            # Test the command without :adjust first
-            run_timew_command(test_cmd, check=True)
-            # If it succeeds, no overlap - use the command as-is
-            cmd_args.append(time_arg)
-        except TimewarriorError as e:
-            error_msg = str(e)
-            if "You cannot overlap intervals" in error_msg:
-                # There's an overlap - ask for confirmation before using :adjust  # noqa: E501
+            impacted_entries, impacted_count = _find_impacted_entries(time_arg)
+        except TimewarriorError as ex:
+            # Without today's entries, let timewarrior judge the overlap
+            logger.debug(f"Failed to analyze impacted entries: {ex}")
+            impacted_entries, impacted_count = [], 0
+
+        if impacted_count:
+            # There's an overlap - ask for confirmation before using :adjust
+            rprint(
+                f"[yellow]⚠️  The start time {time_arg} would overlap with existing intervals.[/yellow]"  # noqa: E501
+            )
+            display_entries(
+                impacted_entries,
+                "Entries that would be impacted:",
+            )
+            if impacted_count > MAX_IMPACTED_SHOWN:
                 rprint(
-                    f"[yellow]⚠️  The start time {time_arg} would overlap with existing intervals.[/yellow]"  # noqa: E501
+                    f"[dim]... and {impacted_count - MAX_IMPACTED_SHOWN} more entries[/dim]"  # noqa: E501
                 )
 
-                # Show only the entries that would actually be impacted
-                try:
-                    from datetime import time as Time
-
-                    # Parse the input time (handle formats like "06:40" or "0640")  # noqa: E501
-                    time_str = time_arg.replace(
-                        ":", ""
-                    )  # Remove colon if present  # noqa: E501
-                    if len(time_str) == 4 and time_str.isdigit():
-                        input_hour = int(time_str[:2])
-                        input_minute = int(time_str[2:])
-                        input_time = Time(input_hour, input_minute)
-                    else:
-                        raise ValueError(f"Invalid time format: {time_arg}")
-
-                    # Get today's entries and find impacted ones
-                    current_entries = get_current_entries()
-                    impacted_entries = []
-
-                    logger.debug(
-                        f"Checking {len(current_entries)} entries for impact with input time {input_time}"  # noqa: E501
-                    )
-
-                    # Process entries in chronological order (oldest first)
-                    for entry in reversed(current_entries):
-                        entry_start = entry.parse_start().time()
-                        entry_end = entry.parse_end()
-
-                        logger.debug(
-                            f"Entry {entry.id}: {entry_start} - {entry_end.time() if entry_end else 'ongoing'} tags: {entry.tags}"  # noqa: E501
-                        )
-
-                        if entry_end is None:
-                            # Active timer - would be impacted if input time is before its start  # noqa: E501
-                            if input_time <= entry_start:
-                                logger.debug(
-                                    f"Entry {entry.id} would be impacted (active timer would be stopped)"  # noqa: E501
-                                )
-                                impacted_entries.append(entry)
-                        else:
-                            entry_end_time = entry_end.time()
-                            # Entry would be impacted if input time falls within its interval  # noqa: E501
-                            if entry_start <= input_time < entry_end_time:
-                                logger.debug(
-                                    f"Entry {entry.id} would be impacted (would be shortened)"  # noqa: E501
-                                )
-                                impacted_entries.append(entry)
-                            elif input_time < entry_start:
-                                # Starting before this entry - this entry would be impacted  # noqa: E501
-                                logger.debug(
-                                    f"Entry {entry.id} would be impacted (starts after input time)"  # noqa: E501
-                                )
-                                impacted_entries.append(entry)
-                            else:
-                                logger.debug(
-                                    f"Entry {entry.id} not impacted (ends before input time)"  # noqa: E501
-                                )
-
-                    logger.debug(
-                        f"Found {len(impacted_entries)} impacted entries"
-                    )  # noqa: E501
-
-                    if impacted_entries:
-                        # Show impacted entries in the original order (newest first) to match undo format  # noqa: E501
-                        # Limit to first 8 entries to avoid overwhelming output
-                        entries_to_show = list(reversed(impacted_entries))[:8]
-                        display_entries(
-                            entries_to_show,
-                            "Entries that would be impacted:",
-                        )
-
-                        if len(impacted_entries) > 8:
-                            rprint(
-                                f"[dim]... and {len(impacted_entries) - 8} more entries[/dim]"  # noqa: E501
-                            )
-                    else:
-                        logger.debug(
-                            "No impacted entries found, this might be a logic error"  # noqa: E501
-                        )
-
-                except Exception as ex:
-                    logger.debug(f"Failed to analyze impacted entries: {ex}")
-                    # Fallback to showing recent entries
-                    current_entries = get_current_entries()
-                    if current_entries and len(current_entries) > 0:
-                        display_entries(
-                            current_entries[-2:], "Recent entries:"
-                        )  # noqa: E501
-
-                confirm = typer.confirm(
-                    "Automatically adjust conflicting intervals?"
-                )  # noqa: E501
-                if confirm:
-                    cmd_args.extend([time_arg, ":adjust"])
-                    rprint("[dim]Using :adjust to resolve overlaps...[/dim]")
-                else:
-                    rprint("[yellow]Timer start cancelled.[/yellow]")
-                    return
-            elif "cannot be set in the future" in error_msg:
-                # Provide a hint for future time
-                raise TimeHelperError(
-                    f"{error_msg}\n[yellow]Hint: Provide a past or current time.[/yellow]"  # noqa: E501
-                )
+            confirm = typer.confirm(
+                "Automatically adjust conflicting intervals?"
+            )  # noqa: E501
+            if confirm:
+                cmd_args.extend([time_arg, ":adjust"])
+                rprint("[dim]Using :adjust to resolve overlaps...[/dim]")
             else:
-                # Some other error - re-raise
-                raise
+                rprint("[yellow]Timer start cancelled.[/yellow]")
+                return
+        else:
+            cmd_args.append(time_arg)
 
     logger.debug(f"Running start command: {cmd_args}")
 
@@ -280,6 +281,11 @@ def start_timer(args: Optional[List[str]] = None) -> None:
                 "[dim]  • Manually resolve with: [/dim][cyan]timew modify[/cyan]"  # noqa: E501
             )
             return
+        elif "cannot be set in the future" in error_msg:
+            # Provide a hint for future time
+            raise TimeHelperError(
+                f"{error_msg}\n[yellow]Hint: Provide a past or current time.[/yellow]"  # noqa: E501
+            )
         else:
             # Re-raise other errors to be handled by decorator
             raise
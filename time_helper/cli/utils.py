@@ -2,8 +2,9 @@
 
 import json
 import subprocess
-from datetime import datetime, timedelta
-from typing import List
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import Iterator, List, Tuple
 from rich.console import Console
 from rich import print as rprint
 
@@ -15,6 +16,9 @@ from ..exceptions import TimewarriorError
 logger = get_logger(__name__)
 console = Console()
 
+# Keep raw export chunks far below SQLite's default 1 GB string limit
+EXPORT_CHUNK_CHARS = 10 * 1024 * 1024
+
 
 def run_timew_command(
     args: List[str], check: bool = True
@@ -38,7 +42,7 @@ def run_timew_command(
     try:
         result = subprocess.run(
             cmd, capture_output=True, text=True, check=check
-        )  # noqa: E501
+        )
         logger.debug(f"Command completed with exit code: {result.returncode}")
         if result.stdout:
             logger.debug(f"Stdout: {result.stdout[:200]}...")
@@ -50,10 +54,89 @@ def run_timew_command(
         raise
     except subprocess.CalledProcessError as e:
         # Use stdout if stderr is empty (sometimes timewarrior prints errors to stdout)  # noqa: E501
-        error_msg = e.stderr.strip() or e.stdout.strip() or "Unknown error"
+        error_msg = (
+            (e.stderr or "").strip()
+            or (e.stdout or "").strip()
+            or "Unknown error"
+        )
         raise TimewarriorError(error_msg, original_error=e)
 
 
+def _stream_timew_export(args: List[str]) -> Iterator[str]:
+    """Yield ``timew export`` output line by line as it is produced.
+
+    Args:
+        args: Export arguments (without 'timew export'), e.g. [":all"]
+
+    Yields:
+        Raw output lines
+
+    Raises:
+        TimewarriorError: If timewarrior exits with a non-zero status
+        FileNotFoundError: If timewarrior is not installed
+    """
+    cmd = ["timew", "export"] + args
+    logger.debug(f"Streaming command: {' '.join(cmd)}")
+
+    try:
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+    except FileNotFoundError:
+        logger.error("Timewarrior (timew) not found in PATH")
+        raise
+
+    with proc:
+        yield from proc.stdout
+        stderr = proc.stderr.read()
+
+    logger.debug(f"Command completed with exit code: {proc.returncode}")
+    if proc.returncode != 0:
+        raise TimewarriorError(stderr.strip() or "Unknown error")
+
+
+def iter_timew_export_chunks(
+    args: List[str], max_chars: int = EXPORT_CHUNK_CHARS
+) -> Iterator[str]:
+    """Stream ``timew export`` output as JSON array strings.
+
+    Intervals are passed through undecoded, re-wrapped into arrays of at
+    most roughly ``max_chars`` characters so each chunk stays well within
+    SQLite's maximum string length.
+
+    Args:
+        args: Export arguments (without 'timew export'), e.g. [":all"]
+        max_chars: Soft upper bound on the size of each chunk
+
+    Yields:
+        JSON array strings holding one or more intervals
+
+    Raises:
+        TimewarriorError: If timewarrior exits with a non-zero status
+        FileNotFoundError: If timewarrior is not installed
+    """
+    parts: List[str] = []
+    size = 0
+
+    for line in _stream_timew_export(args):
+        # Drop the surrounding array brackets and trailing separators
+        part = line.strip().strip("[]").strip(",")
+        if not part:
+            continue
+        parts.append(part)
+        size += len(part)
+        if size >= max_chars:
+            yield f"[{','.join(parts)}]"
+            parts = []
+            size = 0
+
+    if parts:
+        yield f"[{','.join(parts)}]"
+
+
 def parse_timew_export(output: str) -> List[TimeEntry]:
     """Parse timewarrior export JSON into TimeEntry objects.
 
@@ -74,7 +157,8 @@ def parse_timew_export(output: str) -> List[TimeEntry]:
 
     try:
         data = json.loads(output)
-        entries = [TimeEntry.from_dict(entry) for entry in data]
+        from_dict = TimeEntry.from_dict
+        entries = [from_dict(entry) for entry in data]
         logger.debug(f"Parsed {len(entries)} entries")
         return entries
     except json.JSONDecodeError as e:
@@ -82,17 +166,17 @@ def parse_timew_export(output: str) -> List[TimeEntry]:
         raise
 
 
-def convert_timespan_format(timespan: str) -> str:
-    """Convert new timespan format (week-1) to timewarrior format.
+@lru_cache(maxsize=32)
+def _convert_timespan(timespan: str, today_ordinal: int) -> str:
+    """Convert a timespan relative to the given day (see below).
 
     Args:
         timespan: Input timespan (e.g., ":week-1", ":week-2")
+        today_ordinal: Proleptic Gregorian ordinal of the current date
 
     Returns:
         Timewarrior-compatible timespan string
     """
-    logger.debug(f"Converting timespan: {timespan}")
-
     # Handle the new format: :week-1, :week-2, etc.
     if not timespan.startswith(":") or "-" not in timespan:
         return timespan
@@ -107,20 +191,32 @@ def convert_timespan_format(timespan: str) -> str:
 
     # Calculate the actual date range for the week
     weeks_ago = int(offset)
-    today = datetime.now()
-    target_date = today - timedelta(weeks=weeks_ago)
+    target_date = date.fromordinal(today_ordinal) - timedelta(weeks=weeks_ago)
 
     # Find Monday of that week (timewarrior weeks start on Monday)
     days_since_monday = target_date.weekday()  # Monday=0, Sunday=6
     monday = target_date - timedelta(days=days_since_monday)
 
     # Format as date range that timewarrior understands
-    monday_str = monday.strftime("%Y-%m-%d")
     sunday = monday + timedelta(days=6)
-    sunday_str = sunday.strftime("%Y-%m-%d")
+    return f"{monday.isoformat()} to {sunday.isoformat()}"
 
-    result = f"{monday_str} to {sunday_str}"
-    logger.debug(f"Converted to: {result}")
+
+def convert_timespan_format(timespan: str) -> str:
+    """Convert new timespan format (week-1) to timewarrior format.
+
+    Results are cached per day, since they only depend on today's date.
+
+    Args:
+        timespan: Input timespan (e.g., ":week-1", ":week-2")
+
+    Returns:
+        Timewarrior-compatible timespan string
+    """
+    logger.debug(f"Converting timespan: {timespan}")
+    result = _convert_timespan(timespan, date.today().toordinal())
+    if result != timespan:
+        logger.debug(f"Converted to: {result}")
     return result
 
 
@@ -186,6 +282,11 @@ def get_current_entries() -> List[TimeEntry]:
         return []
 
 
+def _meaningful_keys(entries: List[TimeEntry]) -> List[Tuple]:
+    """Extract the (id, start, end) fields compared between entry states."""
+    return [(entry.id, entry.start, entry.end) for entry in entries]
+
+
 def entries_have_meaningful_difference(
     before: List[TimeEntry], after: List[TimeEntry]
 ) -> bool:
@@ -205,17 +306,11 @@ def entries_have_meaningful_difference(
         logger.debug("Different number of entries - meaningful change")
         return True
 
-    # Compare each entry for meaningful changes
-    for b_entry, a_entry in zip(before, after):
-        # Check for time changes (start/end times)
-        if b_entry.start != a_entry.start or b_entry.end != a_entry.end:
-            logger.debug("Time changes detected - meaningful change")
-            return True
-
-        # Check for ID changes (new/deleted entries)
-        if b_entry.id != a_entry.id:
-            logger.debug("ID changes detected - meaningful change")
-            return True
+    # Time or ID changes (new/deleted/moved entries) are meaningful;
+    # compare them position by position as plain tuples
+    if _meaningful_keys(before) != _meaningful_keys(after):
+        logger.debug("Time or ID changes detected - meaningful change")
+        return True
 
     logger.debug("Only annotation or tag changes - not meaningful")
     return False
@@ -230,24 +325,24 @@ def display_entries(entries: List[TimeEntry], title: str) -> None:
     """
     logger.debug(f"Displaying {len(entries)} entries with title: {title}")
 
-    rprint(title)
     if not entries:
+        rprint(title)
         rprint("No entries found.")
         return
 
+    # Build every line first and print once, so Rich parses the markup and
+    # writes to the terminal a single time for the whole list
+    lines = [title]
     for i, entry in enumerate(entries, 1):
         start_time = entry.parse_start().strftime("%H:%M")
-
-        if entry.end:
-            end_time = entry.parse_end().strftime("%H:%M")
-            duration = f"{entry.get_duration_hours():.2f}h"
-        else:
-            end_time = "Active"
-            duration = f"{entry.get_duration_hours():.2f}h"
+        end = entry.parse_end()
+        end_time = end.strftime("%H:%M") if end else "Active"
+        duration = f"{entry.get_duration_hours():.2f}h"
 
         annotation = entry.annotation or "No annotation"
-        tags_str = (
-            f"\\[{', '.join(entry.tags)}]" if entry.tags else "\\[no tags]"
-        )  # noqa: E501
-        output_line = f"  {i}. [dim]ID:{entry.id}[/dim] {start_time}-{end_time} ({duration}) {tags_str} {annotation}"  # noqa: E501
-        rprint(output_line)
+        tags_str = f"\\[{', '.join(entry.tags) or 'no tags'}]"
+        lines.append(
+            f"  {i}. [dim]ID:{entry.id}[/dim] {start_time}-{end_time} ({duration}) {tags_str} {annotation}"  # noqa: E501
+        )
+
+    rprint("\n".join(lines))
@@ -2,23 +2,206 @@
 
 import sqlite3
 import os
-from typing import List, Optional, Dict, Any
-from datetime import date, datetime
+from contextlib import contextmanager
+from itertools import islice
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+)
+from datetime import date
 from pathlib import Path
 from .models import TimeEntry, WeeklyReport
 
 
+class TimeEntryRow(NamedTuple):
+    """A ``time_entries`` row as stored, without building a TimeEntry."""
+
+    id: int
+    start_time: str
+    end_time: Optional[str]
+    tag: str
+    annotation: Optional[str]
+    date: str
+    hours: float
+
+
+INSERT_TIME_ENTRY_SQL = """
+    INSERT OR REPLACE INTO time_entries
+    (id, start_time, end_time, tag, annotation, date, hours)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Applied to every connection. WAL needs one fsync per checkpoint rather
+# than two per commit, and NORMAL sync is still crash-safe in WAL mode.
+# auto_vacuum must come first: it is fixed once the WAL switch writes the
+# database header, and is a no-op on databases that already have tables.
+CONNECTION_PRAGMAS = {
+    "auto_vacuum": "INCREMENTAL",
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "temp_store": "MEMORY",
+    "mmap_size": "268435456",
+}
+
+# Durability settings relaxed while bulk loading; the cache can always be
+# rebuilt from timewarrior, so trading crash-safety for speed is acceptable.
+BULK_INSERT_PRAGMAS = {
+    "synchronous": "OFF",
+    "temp_store": "MEMORY",
+    "cache_size": "-65536",
+}
+
+BULK_INSERT_CHUNK_SIZE = 50_000
+
+# timewarrior stores UTC timestamps as e.g. 20240115T083000Z; rewrite them
+# into a form SQLite's date functions understand.
+_TIMEW_TS_SQL = (
+    "substr({0}, 1, 4) || '-' || substr({0}, 5, 2) || '-' || "
+    "substr({0}, 7, 2) || ' ' || substr({0}, 10, 2) || ':' || "
+    "substr({0}, 12, 2) || ':' || substr({0}, 14, 2)"
+)
+
+# Mirrors TimeEntry semantics: the primary tag is the first lowercased tag,
+# the date is the local date of the start time and active intervals are
+# measured up to now.
+STAGE_TIMEW_JSON_SQL = f"""
+    INSERT INTO temp.timew_import
+    (id, start_time, end_time, tag, annotation, date, hours)
+    SELECT id, start_time, end_time, tag, annotation,
+           date(start_ts, 'localtime'),
+           (strftime('%s', COALESCE(end_ts, 'now'))
+            - strftime('%s', start_ts)) / 3600.0
+    FROM (
+        SELECT
+            json_extract(value, '$.id') AS id,
+            json_extract(value, '$.start') AS start_time,
+            json_extract(value, '$.end') AS end_time,
+            py_lower(
+                COALESCE(json_extract(value, '$.tags[0]'), 'untagged')
+            ) AS tag,
+            json_extract(value, '$.annotation') AS annotation,
+            {_TIMEW_TS_SQL.format("json_extract(value, '$.start')")}
+                AS start_ts,
+            CASE WHEN json_extract(value, '$.end') IS NOT NULL
+                THEN {_TIMEW_TS_SQL.format("json_extract(value, '$.end')")}
+            END AS end_ts
+        FROM json_each(?)
+        WHERE json_extract(value, '$.start') IS NOT NULL
+    )
+"""
+
+
+# Per-day, per-tag totals for reports. Stored hours are used for closed
+# intervals; active ones are re-measured up to now like
+# TimeEntry.get_duration_hours. group_concat makes no ordering promise, so
+# each annotation is prefixed with its start time and a record separator
+# (char 30) and the list, joined with the unit separator (char 31), is
+# put in start order by get_daily_tag_aggregates.
+DAILY_TAG_AGGREGATES_SQL = f"""
+    SELECT date, tag,
+           SUM(CASE WHEN end_time IS NULL
+               THEN (strftime('%s', 'now')
+                     - strftime('%s', {_TIMEW_TS_SQL.format("start_time")}))
+                    / 3600.0
+               ELSE hours END),
+           group_concat(
+               start_time || char(30) || NULLIF(annotation, ''), char(31)
+           )
+    FROM time_entries
+    WHERE date BETWEEN ? AND ?{{tag_filter}}
+    GROUP BY date, tag
+    ORDER BY date, tag
+"""
+
+
+def _ordered_annotations(concatenated: Optional[str]) -> List[str]:
+    """Split DAILY_TAG_AGGREGATES_SQL annotations into start order.
+
+    Args:
+        concatenated: The group_concat column, or None without annotations
+
+    Returns:
+        Annotations sorted by the start time they are prefixed with
+    """
+    if not concatenated:
+        return []
+    # timewarrior timestamps are fixed width, so they sort as text
+    keyed = sorted(
+        item.split("\x1e", 1) for item in concatenated.split("\x1f")
+    )
+    return [annotation for _, annotation in keyed]
+
+
+@contextmanager
+def _bulk_insert_pragmas(conn: sqlite3.Connection) -> Iterator[None]:
+    """Apply BULK_INSERT_PRAGMAS, restoring the previous values on exit."""
+    previous = {
+        name: conn.execute(f"PRAGMA {name}").fetchone()[0]
+        for name in BULK_INSERT_PRAGMAS
+    }
+    for name, value in BULK_INSERT_PRAGMAS.items():
+        conn.execute(f"PRAGMA {name}={value}")
+    try:
+        yield
+    finally:
+        for name, value in previous.items():
+            conn.execute(f"PRAGMA {name}={value}")
+
+
 class Database:
     """Handle SQLite database operations for time tracking data."""
 
+    # Database files whose schema has been created by this process
+    _initialized_paths: Set[Path] = set()
+
     def __init__(self, db_path: Optional[str] = None):
         """Initialize database connection and create tables if needed."""
         if db_path is None:
             db_path = self._get_default_db_path()
         self.db_path = Path(db_path)
+        self._conn: Optional[sqlite3.Connection] = None
+
+        # Schema setup only needs to run once per file and process
+        if (
+            self.db_path in Database._initialized_paths
+            and self.db_path.exists()
+        ):
+            return
+
         # Ensure the directory exists
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self.init_db()
+        Database._initialized_paths.add(self.db_path)
+
+    def connect(self) -> sqlite3.Connection:
+        """Return the shared connection, opening it on first use.
+
+        The connection is opened with CONNECTION_PRAGMAS applied and reused
+        for the lifetime of this object. Using it as a context manager
+        commits or rolls back a transaction but does not close it.
+
+        Returns:
+            The sqlite3 connection for this database
+        """
+        if self._conn is None:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            for name, value in CONNECTION_PRAGMAS.items():
+                conn.execute(f"PRAGMA {name}={value}")
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        """Close the shared connection if it is open."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
 
     def _get_default_db_path(self) -> str:
         """Get the default database path in a central location."""
@@ -52,9 +235,8 @@ class Database:
 
     def init_db(self) -> None:
         """Initialize database schema."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.executescript(
-                """
+        with self.connect() as conn:
+            conn.executescript("""
                 CREATE TABLE IF NOT EXISTS time_entries (
                     id INTEGER,
                     start_time TEXT NOT NULL,
@@ -73,48 +255,228 @@ class Database:
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 );
 
-                CREATE INDEX IF NOT EXISTS idx_time_entries_date
-                    ON time_entries(date);
-                CREATE INDEX IF NOT EXISTS idx_time_entries_tag
-                    ON time_entries(tag);
-            """
-            )
+                -- Serves date-range reads and the per-day, per-tag report
+                -- aggregates; supersedes the old single-column date index.
+                DROP INDEX IF EXISTS idx_time_entries_date;
+                CREATE INDEX IF NOT EXISTS idx_time_entries_date_tag
+                    ON time_entries(date, tag);
+
+                -- Returns date-range reads already in (date, start_time)
+                -- order, so listing entries needs no sort step.
+                CREATE INDEX IF NOT EXISTS idx_time_entries_date_start
+                    ON time_entries(date, start_time);
+
+                -- Covers per-tag aggregates (get_all_tags, status) so they
+                -- are answered from the index alone; supersedes the old
+                -- single-column tag index.
+                DROP INDEX IF EXISTS idx_time_entries_tag;
+                CREATE INDEX IF NOT EXISTS idx_time_entries_tag_date_hours
+                    ON time_entries(tag, date, hours);
+            """)
 
     def store_time_entries(
         self, entries: List[TimeEntry], entry_date: date
     ) -> None:  # noqa: E501
         """Store time entries in the database."""
-        with sqlite3.connect(self.db_path) as conn:
-            for entry in entries:
-                tag = entry.get_primary_tag()
-                hours = entry.get_duration_hours()
+        date_str = entry_date.isoformat()
+        rows = [
+            (
+                entry.id,
+                entry.start,
+                entry.end,
+                entry.get_primary_tag(),
+                entry.annotation,
+                date_str,
+                entry.get_duration_hours(),
+            )
+            for entry in entries
+        ]
+
+        # One prepared statement and one transaction for the whole batch
+        with self.connect() as conn:
+            conn.executemany(INSERT_TIME_ENTRY_SQL, rows)
+
+    def bulk_store_time_entries(
+        self,
+        entries: Iterable[TimeEntry],
+        chunk_size: int = BULK_INSERT_CHUNK_SIZE,
+    ) -> int:
+        """Store many time entries in a single transaction.
+
+        Each entry is filed under its ``date``, falling back to the local
+        date of its start time. Rows are written with ``executemany`` in
+        chunks of ``chunk_size`` to keep memory bounded on large imports.
 
+        Args:
+            entries: Entries to store
+            chunk_size: Maximum number of rows per executemany call
+
+        Returns:
+            Number of entries written
+        """
+        rows = (self._entry_to_row(entry) for entry in entries)
+        stored = 0
+
+        with self.connect() as conn:
+            with _bulk_insert_pragmas(conn), conn:
+                while True:
+                    chunk = list(islice(rows, chunk_size))
+                    if not chunk:
+                        break
+                    conn.executemany(INSERT_TIME_ENTRY_SQL, chunk)
+                    stored += len(chunk)
+
+        return stored
+
+    def import_timew_json(
+        self, chunks: Iterable[str]
+    ) -> Tuple[int, int, str, str]:
+        """Import raw ``timew export`` JSON, letting SQLite parse it.
+
+        Each chunk is a JSON array of intervals which is shredded with
+        ``json_each`` inside the database engine, so no Python objects are
+        created per entry. Rows are staged in a temporary table first so
+        the imported date range can be reported. Intervals whose start or
+        end cannot be parsed are skipped.
+
+        Args:
+            chunks: JSON array strings, each within SQLite's length limit
+
+        Returns:
+            Tuple of (imported_count, skipped_count, earliest_date,
+            latest_date)
+        """
+        with self.connect() as conn:
+            conn.create_function("py_lower", 1, str.lower, deterministic=True)
+            # Changing temp_store drops temp tables, so stage inside the block
+            with _bulk_insert_pragmas(conn):
                 conn.execute(
-                    """
-                    INSERT OR REPLACE INTO time_entries
-                    (id, start_time, end_time, tag, annotation, date, hours)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
-                    (
-                        entry.id,
-                        entry.start,
-                        entry.end,
-                        tag,
-                        entry.annotation,
-                        entry_date.isoformat(),
-                        hours,
-                    ),
+                    "CREATE TEMP TABLE timew_import AS "
+                    "SELECT * FROM time_entries WHERE 0"
                 )
+                try:
+                    with conn:
+                        for chunk in chunks:
+                            conn.execute(STAGE_TIMEW_JSON_SQL, (chunk,))
+                        # Unparseable start/end timestamps leave NULLs behind
+                        skipped = conn.execute(
+                            "DELETE FROM temp.timew_import "
+                            "WHERE hours IS NULL OR date IS NULL"
+                        ).rowcount
+                        conn.execute("""
+                            INSERT OR REPLACE INTO time_entries
+                            (id, start_time, end_time, tag, annotation, date,
+                             hours)
+                            SELECT id, start_time, end_time, tag, annotation,
+                                   date, hours
+                            FROM temp.timew_import
+                        """)
+                    count, earliest, latest = conn.execute(
+                        "SELECT COUNT(*), MIN(date), MAX(date) "
+                        "FROM temp.timew_import"
+                    ).fetchone()
+                finally:
+                    conn.execute("DROP TABLE IF EXISTS temp.timew_import")
 
-    def get_time_entries(
+            # Refresh planner statistics now that the table has changed a lot
+            conn.execute("ANALYZE")
+
+        return count, skipped, earliest or "", latest or ""
+
+    def summarize_timew_json(self, chunks: Iterable[str]) -> Dict[str, Any]:
+        """Summarize raw ``timew export`` JSON without storing it.
+
+        The intervals are loaded into a connection-local temporary table
+        and aggregated by SQLite; the database file is not modified.
+
+        Args:
+            chunks: JSON array strings, each within SQLite's length limit
+
+        Returns:
+            Dictionary with total_entries, earliest_date, latest_date,
+            days, unique_tags and top_tags (up to 10 (tag, count) pairs)
+        """
+        with self.connect() as conn:
+            conn.create_function("py_lower", 1, str.lower, deterministic=True)
+            conn.execute("CREATE TEMP TABLE timew_summary (data TEXT)")
+            try:
+                # Roll back a failed load before the table is dropped, or
+                # the rollback would bring the dropped table back
+                with conn:
+                    conn.executemany(
+                        """
+                        INSERT INTO temp.timew_summary (data)
+                        SELECT value FROM json_each(?)
+                        WHERE json_extract(value, '$.start') IS NOT NULL
+                    """,
+                        ((chunk,) for chunk in chunks),
+                    )
+
+                start_ts = _TIMEW_TS_SQL.format(
+                    "json_extract(data, '$.start')"
+                )
+                total, earliest, latest, days = conn.execute(f"""
+                    SELECT COUNT(*), MIN(day), MAX(day), COUNT(DISTINCT day)
+                    FROM (
+                        SELECT date({start_ts}, 'localtime') AS day
+                        FROM temp.timew_summary
+                    )
+                """).fetchone()
+
+                tag_counts = conn.execute("""
+                    SELECT py_lower(tags.value) AS tag, COUNT(*) AS uses
+                    FROM temp.timew_summary, json_each(data, '$.tags') AS tags
+                    GROUP BY tag
+                    ORDER BY uses DESC, tag
+                """).fetchall()
+            finally:
+                conn.execute("DROP TABLE IF EXISTS temp.timew_summary")
+
+        return {
+            "total_entries": total,
+            "earliest_date": earliest or "",
+            "latest_date": latest or "",
+            "days": days,
+            "unique_tags": len(tag_counts),
+            "top_tags": tag_counts[:10],
+        }
+
+    @staticmethod
+    def _entry_to_row(entry: TimeEntry) -> Tuple:
+        """Convert a TimeEntry into a ``time_entries`` row tuple."""
+        entry_date = entry.date or entry.parse_start().date()
+        return (
+            entry.id,
+            entry.start,
+            entry.end,
+            entry.get_primary_tag(),
+            entry.annotation,
+            entry_date.isoformat(),
+            entry.get_duration_hours(),
+        )
+
+    def iter_time_entries(
         self,
         start_date: date,
         end_date: date,
-        tags: Optional[List[str]] = None,  # noqa: E501
-    ) -> List[TimeEntry]:
-        """Get time entries for a date range, optionally filtered by tags."""
+        tags: Optional[List[str]] = None,
+    ) -> Iterator[TimeEntryRow]:
+        """Iterate over stored rows for a date range without building models.
+
+        Rows are yielded straight from the cursor, in date and start order,
+        with the date left as an ISO string and the stored hours included,
+        for callers that only aggregate.
+
+        Args:
+            start_date: First date of the range (inclusive)
+            end_date: Last date of the range (inclusive)
+            tags: Optional list of tags to filter by
+
+        Yields:
+            One TimeEntryRow per stored entry
+        """
         query = """
-            SELECT id, start_time, end_time, tag, annotation, date
+            SELECT id, start_time, end_time, tag, annotation, date, hours
             FROM time_entries
             WHERE date BETWEEN ? AND ?
         """
@@ -127,26 +489,68 @@ class Database:
 
         query += " ORDER BY date, start_time"
 
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute(query, params)
+        with self.connect() as conn:
+            for row in conn.execute(query, params):
+                yield TimeEntryRow._make(row)
 
-            entries = []
-            for row in cursor.fetchall():
-                entry = TimeEntry(
-                    id=row[0],
-                    start=row[1],
-                    end=row[2],
-                    tags=[row[3]],  # Single tag as list
-                    annotation=row[4],
-                    date=datetime.fromisoformat(row[5]).date(),
-                )
-                entries.append(entry)
+    def get_time_entries(
+        self,
+        start_date: date,
+        end_date: date,
+        tags: Optional[List[str]] = None,  # noqa: E501
+    ) -> List[TimeEntry]:
+        """Get time entries for a date range, optionally filtered by tags."""
+        return [
+            TimeEntry(
+                id=row.id,
+                start=row.start_time,
+                end=row.end_time,
+                tags=[row.tag],  # Single tag as list
+                annotation=row.annotation,
+                date=date.fromisoformat(row.date),
+                cached_hours=row.hours,
+            )
+            for row in self.iter_time_entries(start_date, end_date, tags)
+        ]
+
+    def get_daily_tag_aggregates(
+        self,
+        start_date: date,
+        end_date: date,
+        tags: Optional[List[str]] = None,
+    ) -> List[Tuple[date, str, float, List[str]]]:
+        """Get per-day, per-tag totals for a date range, summed by SQLite.
 
-            return entries
+        Args:
+            start_date: First date of the range (inclusive)
+            end_date: Last date of the range (inclusive)
+            tags: Optional list of tags to restrict the totals to
+
+        Returns:
+            List of (date, tag, total_hours, annotations) tuples ordered by
+            date and tag, with annotations in start order
+        """
+        params = [start_date.isoformat(), end_date.isoformat()]
+        tag_filter = ""
+        if tags:
+            tag_filter = f" AND tag IN ({','.join('?' * len(tags))})"
+            params.extend(tags)
+
+        query = DAILY_TAG_AGGREGATES_SQL.format(tag_filter=tag_filter)
+        with self.connect() as conn:
+            return [
+                (
+                    date.fromisoformat(day),
+                    tag,
+                    hours,
+                    _ordered_annotations(annotations),
+                )
+                for day, tag, hours, annotations in conn.execute(query, params)
+            ]
 
     def get_weekly_report(self, week_start: date) -> Optional[WeeklyReport]:
         """Get cached weekly report."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self.connect() as conn:
             cursor = conn.execute(
                 """
                 SELECT report_data FROM weekly_reports
@@ -169,11 +573,18 @@ class Database:
         # Would need to serialize the report object
         pass
 
+    def get_tag_names(self) -> List[str]:
+        """Get the distinct tag names, answered from the tag index alone."""
+        with self.connect() as conn:
+            cursor = conn.execute(
+                "SELECT DISTINCT tag FROM time_entries ORDER BY tag"
+            )
+            return [row[0] for row in cursor]
+
     def get_all_tags(self) -> List[Dict[str, Any]]:
         """Get all unique tags with statistics."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute(
-                """
+        with self.connect() as conn:
+            cursor = conn.execute("""
                 SELECT
                     tag,
                     SUM(hours) as total_hours,
@@ -181,8 +592,7 @@ class Database:
                 FROM time_entries
                 GROUP BY tag
                 ORDER BY total_hours DESC
-            """
-            )
+            """)
 
             tags = []
             for row in cursor.fetchall():
@@ -191,7 +601,7 @@ class Database:
                         "tag": row[0],
                         "total_hours": row[1],
                         "last_used": (
-                            datetime.fromisoformat(row[2]).date()
+                            date.fromisoformat(row[2])
                             if row[2]
                             else None  # noqa: E501
                         ),
@@ -2,8 +2,12 @@
 
 import sys
 from pathlib import Path
+from typing import Optional
 from loguru import logger
 
+# Verbosity the sinks are currently configured for, if any
+_configured_verbosity: Optional[int] = None
+
 
 def setup_logging(verbosity: int = 0) -> None:
     """Configure loguru logging with appropriate levels and formats.
@@ -11,6 +15,14 @@ def setup_logging(verbosity: int = 0) -> None:
     Args:
         verbosity: Verbosity level (0=silent, 1=info, 2=debug)
     """
+    global _configured_verbosity
+
+    # The CLI configures logging at import and again once options are
+    # parsed; adding loguru sinks is slow, so keep them if nothing changed
+    if verbosity == _configured_verbosity:
+        return
+    _configured_verbosity = verbosity
+
     # Remove default handler
     logger.remove()
 
@@ -56,6 +68,8 @@ def setup_logging(verbosity: int = 0) -> None:
             retention="1 month",
             compression="gz",
             enqueue=True,
+            # Open the file on the first record rather than at startup
+            delay=True,
         )
 
         # Only log initialization messages if verbosity is enabled
@@ -1,58 +1,110 @@
 """Data models for time tracking entries and reports."""
 
-from typing import List, Optional, Dict, Any
-from dataclasses import dataclass
-from datetime import datetime, date as Date, timezone
-from pydantic import BaseModel, field_validator
+from sys import intern
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from dataclasses import dataclass, field
+from functools import cached_property
+from datetime import datetime, date as Date, timedelta, timezone
 
 
-class TimeEntry(BaseModel):
+def _parse_timew_timestamp(value: str) -> datetime:
+    """Parse a timewarrior UTC timestamp such as 20240115T083000Z.
+
+    Python 3.11's fromisoformat accepts this basic ISO 8601 form and parses
+    it in C, many times faster than strptime with a format string.
+    """
+    return datetime.fromisoformat(value).replace(tzinfo=timezone.utc)
+
+
+@dataclass
+class TimeEntry:
     """Represents a single time tracking entry."""
 
     id: int
     start: str
     end: Optional[str] = None  # Optional to handle active timers
-    tags: List[str] = []  # Default to empty list for entries without tags
+    # Default to empty list for entries without tags
+    tags: List[str] = field(default_factory=list)
     annotation: Optional[str] = None
     date: Optional[Date] = None
-
-    @field_validator("tags")
-    @classmethod
-    def normalize_tags(cls, v: List[str]) -> List[str]:
-        """Normalize tags to lowercase for consistency."""
-        return [tag.lower() for tag in v] if v else []
+    # Duration already known to the caller (e.g. the stored hours column)
+    cached_hours: Optional[float] = field(
+        default=None, compare=False, repr=False
+    )
+
+    def __post_init__(self) -> None:
+        # Normalize tags to lowercase for consistency; interning lets the
+        # many entries sharing a tag share one string, and makes dict
+        # lookups keyed on tags hit the identity fast path
+        if self.tags:
+            self.tags = [intern(tag.lower()) for tag in self.tags]
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "TimeEntry":
-        """Create a TimeEntry from a dictionary with normalized tags."""
-        return cls(**data)
+        """Create a TimeEntry from a dictionary with normalized tags.
+
+        Keys other than the entry fields (if timewarrior adds any) are
+        ignored.
+        """
+        return cls(
+            id=data["id"],
+            start=data["start"],
+            end=data.get("end"),
+            tags=data.get("tags") or [],
+            annotation=data.get("annotation"),
+        )
+
+    @cached_property
+    def _start_utc(self) -> datetime:
+        """Start time as parsed, in UTC."""
+        return _parse_timew_timestamp(self.start)
+
+    @cached_property
+    def _end_utc(self) -> Optional[datetime]:
+        """End time as parsed, in UTC, or None for active timers."""
+        if self.end is None:
+            return None
+        return _parse_timew_timestamp(self.end)
+
+    @cached_property
+    def start_dt(self) -> datetime:
+        """Start time as a local datetime, parsed once per entry."""
+        # Convert to local timezone
+        return self._start_utc.astimezone()
+
+    @cached_property
+    def end_dt(self) -> Optional[datetime]:
+        """End time as a local datetime, or None for active timers."""
+        end_utc = self._end_utc
+        # Convert to local timezone
+        return end_utc.astimezone() if end_utc is not None else None
 
     def parse_start(self) -> datetime:
         """Parse the start time string to datetime with timezone conversion to local time."""  # noqa: E501
-        utc_dt = datetime.strptime(self.start, "%Y%m%dT%H%M%SZ").replace(
-            tzinfo=timezone.utc
-        )
-        return utc_dt.astimezone()  # Convert to local timezone
+        return self.start_dt
 
     def parse_end(self) -> Optional[datetime]:
         """Parse the end time string to datetime with timezone conversion to local time. Returns None for active timers."""  # noqa: E501
+        return self.end_dt
+
+    @cached_property
+    def _closed_hours(self) -> Optional[float]:
+        """Duration of a finished entry in hours, or None for active timers."""
         if self.end is None:
             return None
-        utc_dt = datetime.strptime(self.end, "%Y%m%dT%H%M%SZ").replace(
-            tzinfo=timezone.utc
-        )
-        return utc_dt.astimezone()  # Convert to local timezone
+        if self.cached_hours is not None:
+            return self.cached_hours
+        # Elapsed time is the same in any timezone, so stay in UTC
+        return (self._end_utc - self._start_utc).total_seconds() / 3600
 
     def get_duration_hours(self) -> float:
         """Calculate duration in hours. For active timers, calculates up to now."""  # noqa: E501
-        start_dt = self.parse_start()
-        end_dt = self.parse_end()
-
-        if end_dt is None:
-            # Active timer - calculate duration up to now (in local timezone)
-            end_dt = datetime.now().astimezone()
+        hours = self._closed_hours
+        if hours is not None:
+            return hours
 
-        duration = end_dt - start_dt
+        # Active timer - calculate duration up to now
+        duration = datetime.now(timezone.utc) - self._start_utc
         return duration.total_seconds() / 3600
 
     def get_primary_tag(self) -> str:
@@ -71,6 +123,11 @@ class TagSummary:
 
     def get_formatted_annotations(self) -> List[str]:
         """Get formatted annotation lines for display."""
+        return self.formatted_annotations
+
+    @cached_property
+    def formatted_annotations(self) -> List[str]:
+        """Formatted annotation lines, computed once per summary."""
         if not self.annotations:
             # Provide generic description based on tag name
             return [f"Work on {self.tag} related tasks"]
@@ -102,8 +159,8 @@ class DailyReport:
         return self.date.strftime("%A")
 
     def get_formatted_date(self) -> str:
-        """Get formatted date string."""
-        return self.date.strftime("%Y-%m-%d")
+        """Get formatted date string (YYYY-MM-DD)."""
+        return self.date.isoformat()
 
 
 @dataclass
@@ -134,15 +191,11 @@ class WeeklyReport:
             else:
                 return f"{self.start_date.strftime('%B %d, %Y')} - {end_str}"
 
-        # Fallback to logic for standard week
-        week_end = self.start_date
-        # ... existing logic or simplified ...
-        # If we don't have explicit end_date, calculate it
+        # Without an explicit end_date, end at the last reported day or
+        # fall back to a standard week
         if self.daily_reports:
-            week_end = max(self.daily_reports.keys())
+            week_end = max(self.daily_reports)
         else:
-            from datetime import timedelta
-
             week_end = self.start_date + timedelta(days=6)
 
         end_str = week_end.strftime("%B %d, %Y")
@@ -150,8 +203,26 @@ class WeeklyReport:
             return f"{start_str} - {end_str}"
         return f"{self.start_date.strftime('%B %d, %Y')} - {end_str}"
 
+    def iter_days(self) -> Iterator[Tuple[Date, Optional[DailyReport]]]:
+        """Iterate over every date in the report range in order.
+
+        Yields:
+            (date, daily report) pairs, with None for days without a report
+        """
+        end_date = self.end_date or self.week_start + timedelta(days=6)
+        daily_reports = self.daily_reports
+        for offset in range((end_date - self.week_start).days + 1):
+            day = self.week_start + timedelta(days=offset)
+            yield day, daily_reports.get(day)
+
     def get_sorted_daily_reports(self) -> List[DailyReport]:
         """Get daily reports sorted by date."""
+        # Walk the known date range instead of sorting the keys
+        reports = [report for _, report in self.iter_days() if report]
+        if len(reports) == len(self.daily_reports):
+            return reports
+
+        # Some reports fall outside the range; sort them all
         return [
             self.daily_reports[date]
             for date in sorted(self.daily_reports.keys())  # noqa: E501
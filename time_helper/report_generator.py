@@ -1,13 +1,55 @@
 """Enhanced report generator with rich formatting and reports."""
 
-from typing import List, Dict
+from typing import List, Dict, Tuple
 from datetime import date
 from collections import defaultdict
-from rich.console import Console
+from dataclasses import dataclass, field
+from functools import lru_cache
+from zlib import crc32
+from rich.console import Console, Group, RenderableType
 from rich.table import Table
-from rich import print as rprint
+from rich.text import Text
 from .models import TimeEntry, WeeklyReport, DailyReport, TagSummary
 
+# Rich color names assigned to tags in the console report
+TAG_COLORS = (
+    "red",
+    "green",
+    "yellow",
+    "blue",
+    "magenta",
+    "cyan",
+    "bright_red",
+    "bright_green",
+    "bright_yellow",
+    "bright_blue",
+    "bright_magenta",
+    "bright_cyan",
+)
+
+
+@lru_cache(maxsize=1024)
+def _tag_color(tag: str) -> str:
+    """Pick a tag's color from TAG_COLORS, resolved once per tag."""
+    # crc32 rather than hash(): str hashes are salted per process, which
+    # gave a tag a different color on every run
+    return TAG_COLORS[crc32(tag.encode()) % len(TAG_COLORS)]
+
+
+@lru_cache(maxsize=4096)
+def _day_abbrev(day: date) -> str:
+    """Get a date's abbreviated day name (e.g. 'Mon'), formatted once."""
+    return day.strftime("%a")
+
+
+@dataclass
+class _TagAccumulator:
+    """Running totals for one tag, per day or over the whole report."""
+
+    hours: float = 0.0
+    entries: List[TimeEntry] = field(default_factory=list)
+    annotations: List[str] = field(default_factory=list)
+
 
 class ReportGenerator:
     """Generate comprehensive weekly reports with rich formatting."""
@@ -24,69 +66,54 @@ class ReportGenerator:
     ) -> WeeklyReport:
         """Generate a comprehensive report from time entries."""
 
-        # Group entries by date and tag
-        daily_data: Dict[date, Dict[str, List[TimeEntry]]] = defaultdict(
-            lambda: defaultdict(list)
+        # Accumulate per (date, tag) and per tag in a single pass over the
+        # entries
+        daily_acc: Dict[Tuple[date, str], _TagAccumulator] = defaultdict(
+            _TagAccumulator
         )
-        weekly_data: Dict[str, List[TimeEntry]] = defaultdict(list)
+        weekly_acc: Dict[str, _TagAccumulator] = defaultdict(_TagAccumulator)
 
         for entry in entries:
             entry_date = entry.date or start_date  # Fallback
             tag = entry.get_primary_tag()
+            hours = entry.get_duration_hours()
+            annotation = entry.annotation
 
-            daily_data[entry_date][tag].append(entry)
-            weekly_data[tag].append(entry)
+            for acc in (daily_acc[(entry_date, tag)], weekly_acc[tag]):
+                acc.hours += hours
+                acc.entries.append(entry)
+                if annotation:
+                    acc.annotations.append(annotation)
 
         # Generate daily reports
         daily_reports: Dict[date, DailyReport] = {}
 
-        for day_date, day_tags in daily_data.items():
-            tag_summaries: Dict[str, TagSummary] = {}
-            daily_total = 0.0
-
-            for tag, tag_entries in day_tags.items():
-                total_hours = sum(
-                    entry.get_duration_hours() for entry in tag_entries
-                )  # noqa: E501
-                annotations = [
-                    entry.annotation
-                    for entry in tag_entries
-                    if entry.annotation  # noqa: E501
-                ]
-
-                tag_summaries[tag] = TagSummary(
-                    tag=tag,
-                    total_hours=total_hours,
-                    entries=tag_entries,
-                    annotations=annotations,
+        for (day_date, tag), acc in daily_acc.items():
+            daily_report = daily_reports.get(day_date)
+            if daily_report is None:
+                daily_report = daily_reports[day_date] = DailyReport(
+                    date=day_date, tag_summaries={}, total_hours=0.0
                 )
-                daily_total += total_hours
-
-            daily_reports[day_date] = DailyReport(
-                date=day_date,
-                tag_summaries=tag_summaries,
-                total_hours=daily_total,  # noqa: E501
+            daily_report.tag_summaries[tag] = TagSummary(
+                tag=tag,
+                total_hours=acc.hours,
+                entries=acc.entries,
+                annotations=acc.annotations,
             )
+            daily_report.total_hours += acc.hours
 
         # Generate weekly summaries
         weekly_summaries: Dict[str, TagSummary] = {}
         total_weekly_hours = 0.0
 
-        for tag, tag_entries in weekly_data.items():
-            total_hours = sum(
-                entry.get_duration_hours() for entry in tag_entries
-            )  # noqa: E501
-            annotations = [
-                entry.annotation for entry in tag_entries if entry.annotation
-            ]
-
+        for tag, acc in weekly_acc.items():
             weekly_summaries[tag] = TagSummary(
                 tag=tag,
-                total_hours=total_hours,
-                entries=tag_entries,
-                annotations=annotations,
+                total_hours=acc.hours,
+                entries=acc.entries,
+                annotations=acc.annotations,
             )
-            total_weekly_hours += total_hours
+            total_weekly_hours += acc.hours
 
         return WeeklyReport(
             week_start=start_date,
@@ -97,6 +124,55 @@ class ReportGenerator:
             tags=tags,
         )
 
+    def generate_report_from_aggregates(
+        self,
+        aggregates: List[Tuple[date, str, float, List[str]]],
+        start_date: date,
+        end_date: date,
+        tags: List[str] = None,
+    ) -> WeeklyReport:
+        """Generate a report from per-day, per-tag totals.
+
+        The totals come from Database.get_daily_tag_aggregates, so no
+        TimeEntry objects are built; the summaries carry no entries.
+        """
+        daily_reports: Dict[date, DailyReport] = {}
+        weekly_hours: Dict[str, float] = defaultdict(float)
+        weekly_annotations: Dict[str, List[str]] = defaultdict(list)
+
+        for day_date, tag, hours, annotations in aggregates:
+            daily_report = daily_reports.get(day_date)
+            if daily_report is None:
+                daily_report = daily_reports[day_date] = DailyReport(
+                    date=day_date, tag_summaries={}, total_hours=0.0
+                )
+            daily_report.tag_summaries[tag] = TagSummary(
+                tag=tag, total_hours=hours, entries=[], annotations=annotations
+            )
+            daily_report.total_hours += hours
+
+            weekly_hours[tag] += hours
+            weekly_annotations[tag].extend(annotations)
+
+        weekly_summaries = {
+            tag: TagSummary(
+                tag=tag,
+                total_hours=hours,
+                entries=[],
+                annotations=weekly_annotations[tag],
+            )
+            for tag, hours in weekly_hours.items()
+        }
+
+        return WeeklyReport(
+            week_start=start_date,
+            daily_reports=daily_reports,
+            weekly_summaries=weekly_summaries,
+            total_hours=sum(weekly_hours.values()),
+            end_date=end_date,
+            tags=tags,
+        )
+
     def generate_weekly_report(
         self, entries: List[TimeEntry], week_start: date
     ) -> WeeklyReport:
@@ -109,32 +185,41 @@ class ReportGenerator:
 
     def print_weekly_report(self, report: WeeklyReport) -> None:
         """Print a comprehensive weekly report with rich formatting."""
+        # The whole report is collected first and written with one print
+        renderables: List[RenderableType] = []
 
         # Header
         title = f"Time Report - {report.get_week_range_string()}"
-        rprint(f"\n[bold blue]{title}[/bold blue]")
+        renderables.append(f"\n[bold blue]{title}[/bold blue]")
 
         if report.tags:
-            rprint(f"[dim]Filtered by tags: {', '.join(report.tags)}[/dim]")
+            renderables.append(
+                f"[dim]Filtered by tags: {', '.join(report.tags)}[/dim]"
+            )
 
-        rprint()
+        renderables.append("")
 
         # Daily reports
-        for daily_report in report.get_sorted_daily_reports():
-            self._print_daily_report(daily_report)
-            rprint()  # Empty line between days
+        daily_reports = report.get_sorted_daily_reports()
+        for daily_report in daily_reports:
+            renderables.extend(self._render_daily_report(daily_report))
+            renderables.append("")  # Empty line between days
 
         # Weekly summary
-        self._print_weekly_summary(report)
+        renderables.extend(self._render_weekly_summary(report, daily_reports))
+
+        self.console.print(Group(*renderables))
 
-    def _print_daily_report(self, daily_report: DailyReport) -> None:
-        """Print a single day's report."""
+    def _render_daily_report(
+        self, daily_report: DailyReport
+    ) -> List[RenderableType]:
+        """Render a single day's report as markup lines."""
         day_header = f"{daily_report.get_day_name()} ({daily_report.get_formatted_date()}):"  # noqa: E501
-        rprint(f"[bold green]{day_header}[/bold green]")
+        lines = [f"[bold green]{day_header}[/bold green]"]
 
         if not daily_report.tag_summaries:
-            rprint("  [dim]No time tracked[/dim]")
-            return
+            lines.append("  [dim]No time tracked[/dim]")
+            return lines
 
         # Sort tags by hours (descending)
         sorted_tags = sorted(
@@ -146,27 +231,43 @@ class ReportGenerator:
         for tag_summary in sorted_tags:
             # Tag line with hours
             tag_color = self._get_tag_color(tag_summary.tag)
-            rprint(
+            lines.append(
                 f"  [{tag_color}]{tag_summary.tag}: {tag_summary.total_hours:.2f} hours[/{tag_color}]"  # noqa: E501
             )
 
-            # Annotation lines
-            annotations = tag_summary.get_formatted_annotations()
-            for annotation in annotations:
-                rprint(f"    [dim]{annotation}[/dim]")
+            # Annotation lines, as one pre-styled Text so Rich does not
+            # parse markup for every annotation
+            annotations = tag_summary.formatted_annotations
+            if annotations:
+                lines.append(
+                    Text(
+                        "\n".join(f"    {a}" for a in annotations),
+                        style="dim",
+                    )
+                )
 
         # Daily total
-        rprint(
+        lines.append(
             f"[bold]Daily Total: {daily_report.total_hours:.2f} hours[/bold]"
         )  # noqa: E501
-
-    def _print_weekly_summary(self, report: WeeklyReport) -> None:
-        """Print the weekly summary section."""
-        rprint("[bold blue]Weekly Summary:[/bold blue]")
+        return lines
+
+    def _render_weekly_summary(
+        self, report: WeeklyReport, daily_reports: List[DailyReport]
+    ) -> List[RenderableType]:
+        """Render the weekly summary section.
+
+        Args:
+            report: Report to summarize
+            daily_reports: The report's daily reports, sorted by date
+        """
+        renderables: List[RenderableType] = [
+            "[bold blue]Weekly Summary:[/bold blue]"
+        ]
 
         if not report.weekly_summaries:
-            rprint("  [dim]No time tracked this week[/dim]")
-            return
+            renderables.append("  [dim]No time tracked this week[/dim]")
+            return renderables
 
         # Create a table for the weekly summary
         table = Table(show_header=True, header_style="bold magenta")
@@ -174,11 +275,9 @@ class ReportGenerator:
         table.add_column("Total Hours", justify="right", style="green")
         table.add_column("Daily Breakdown", style="yellow")
 
+        breakdowns = self._get_daily_breakdowns(daily_reports)
         for tag_summary in report.get_sorted_weekly_summaries():
-            # Calculate daily breakdown
-            daily_breakdown = self._get_daily_breakdown(
-                tag_summary.tag, report.daily_reports
-            )
+            daily_breakdown = breakdowns.get(tag_summary.tag, "No hours")
 
             table.add_row(
                 tag_summary.tag,
@@ -186,79 +285,64 @@ class ReportGenerator:
                 daily_breakdown,  # noqa: E501
             )
 
-        self.console.print(table)
+        renderables.append(table)
 
         # Total hours
-        rprint(
+        renderables.append(
             f"\n[bold green]Total Hours: {report.total_hours:.2f} hours[/bold green]"  # noqa: E501
         )
+        return renderables
+
+    def _get_daily_breakdowns(
+        self, daily_reports: List[DailyReport]
+    ) -> Dict[str, str]:
+        """Get the daily breakdown string of every tag in one sweep.
+
+        Args:
+            daily_reports: Daily reports sorted by date
+
+        Returns:
+            Breakdown per tag; tags without tracked hours are absent and
+            callers show "No hours"
+        """
+        breakdown_parts: Dict[str, List[str]] = defaultdict(list)
+
+        for daily_report in daily_reports:
+            day_abbrev = _day_abbrev(daily_report.date)
+            for tag, tag_summary in daily_report.tag_summaries.items():
+                breakdown_parts[tag].append(
+                    f"{day_abbrev}: {tag_summary.total_hours:.2f}"
+                )
 
-    def _get_daily_breakdown(
-        self, tag: str, daily_reports: Dict[date, DailyReport]
-    ) -> str:
-        """Get daily breakdown string for a tag."""
-        breakdown_parts = []
-
-        for report_date in sorted(daily_reports.keys()):
-            daily_report = daily_reports[report_date]
-            if tag in daily_report.tag_summaries:
-                hours = daily_report.tag_summaries[tag].total_hours
-                day_abbrev = report_date.strftime("%a")
-                breakdown_parts.append(f"{day_abbrev}: {hours:.2f}")
-
-        return ", ".join(breakdown_parts) if breakdown_parts else "No hours"
+        return {
+            tag: ", ".join(parts) for tag, parts in breakdown_parts.items()
+        }
 
     def _get_tag_color(self, tag: str) -> str:
         """Get a consistent color for a tag based on its name."""
-        # Simple hash-based color assignment
-        colors = [
-            "red",
-            "green",
-            "yellow",
-            "blue",
-            "magenta",
-            "cyan",
-            "bright_red",
-            "bright_green",
-            "bright_yellow",
-            "bright_blue",
-            "bright_magenta",
-            "bright_cyan",
-        ]
-
-        color_index = hash(tag) % len(colors)
-        return colors[color_index]
+        return _tag_color(tag)
 
     def format_as_markdown(self, report: WeeklyReport) -> str:
         """Format the report as Markdown."""
-        lines = []
-
-        # Header
+        # Whole blocks are added at once and joined a single time at the end
         title = f"Time Report - {report.get_week_range_string()}"
-        lines.append(f"# {title}")
-        lines.append("")
+        lines = [f"# {title}", ""]
 
         if report.tags:
-            lines.append(f"> Filtered by tags: {', '.join(report.tags)}")
-            lines.append("")
+            lines += (f"> Filtered by tags: {', '.join(report.tags)}", "")
 
         # Daily reports
-        lines.append("## Daily Reports")
-        lines.append("")
+        lines += ("## Daily Reports", "")
 
-        for daily_report in report.get_sorted_daily_reports():
+        daily_reports = report.get_sorted_daily_reports()
+        for daily_report in daily_reports:
             day_header = f"{daily_report.get_day_name()} ({daily_report.get_formatted_date()})"  # noqa: E501
-            lines.append(f"### {day_header}")
-            lines.append("")
+            lines += (f"### {day_header}", "")
 
             if not daily_report.tag_summaries:
-                lines.append("*No time tracked*")
-                lines.append("")
+                lines += ("*No time tracked*", "")
                 continue
 
-            lines.append("| Tag | Hours | Annotations |")
-            lines.append("| :--- | :--- | :--- |")
-
             # Sort tags by hours (descending)
             sorted_tags = sorted(
                 daily_report.tag_summaries.values(),
@@ -266,41 +350,36 @@ class ReportGenerator:
                 reverse=True,
             )
 
-            for tag_summary in sorted_tags:
-                annotations = ", ".join(
-                    tag_summary.get_formatted_annotations()
-                )  # noqa: E501
-                lines.append(
-                    f"| {tag_summary.tag} | {tag_summary.total_hours:.2f} | {annotations} |"  # noqa: E501
-                )
-
-            lines.append("")
-            lines.append(
-                f"**Daily Total: {daily_report.total_hours:.2f} hours**"
-            )  # noqa: E501
-            lines.append("")
+            lines += (
+                "| Tag | Hours | Annotations |",
+                "| :--- | :--- | :--- |",
+            )
+            lines += [
+                f"| {tag_summary.tag} | {tag_summary.total_hours:.2f} | {', '.join(tag_summary.formatted_annotations)} |"  # noqa: E501
+                for tag_summary in sorted_tags
+            ]
+            lines += (
+                "",
+                f"**Daily Total: {daily_report.total_hours:.2f} hours**",
+                "",
+            )
 
         # Weekly summary
-        lines.append("## Weekly Summary")
-        lines.append("")
+        lines += ("## Weekly Summary", "")
 
         if not report.weekly_summaries:
             lines.append("*No time tracked this week*")
         else:
-            lines.append("| Tag | Total Hours | Daily Breakdown |")
-            lines.append("| :--- | :--- | :--- |")
-
-            for tag_summary in report.get_sorted_weekly_summaries():
-                # Calculate daily breakdown
-                daily_breakdown = self._get_daily_breakdown(
-                    tag_summary.tag, report.daily_reports
-                )
-                lines.append(
-                    f"| {tag_summary.tag} | {tag_summary.total_hours:.2f} | {daily_breakdown} |"  # noqa: E501
-                )
-
-            lines.append("")
-            lines.append(f"**Total Hours: {report.total_hours:.2f} hours**")
+            breakdowns = self._get_daily_breakdowns(daily_reports)
+            lines += (
+                "| Tag | Total Hours | Daily Breakdown |",
+                "| :--- | :--- | :--- |",
+            )
+            lines += [
+                f"| {tag_summary.tag} | {tag_summary.total_hours:.2f} | {breakdowns.get(tag_summary.tag, 'No hours')} |"  # noqa: E501
+                for tag_summary in report.get_sorted_weekly_summaries()
+            ]
+            lines += ("", f"**Total Hours: {report.total_hours:.2f} hours**")
 
         return "\n".join(lines)
 
@@ -310,12 +389,14 @@ class ReportGenerator:
         import csv
 
         output = io.StringIO()
-        fieldnames = ["Date", "Day", "Tag", "Hours", "Annotations"]
-        writer = csv.DictWriter(output, fieldnames=fieldnames)
+        writer = csv.writer(output)
 
-        writer.writeheader()
+        writer.writerow(("Date", "Day", "Tag", "Hours", "Annotations"))
 
         for daily_report in report.get_sorted_daily_reports():
+            date_str = daily_report.get_formatted_date()
+            day_name = daily_report.get_day_name()
+
             # Sort tags by hours (descending)
             sorted_tags = sorted(
                 daily_report.tag_summaries.values(),
@@ -323,18 +404,15 @@ class ReportGenerator:
                 reverse=True,
             )
 
-            for tag_summary in sorted_tags:
-                annotations = "; ".join(
-                    tag_summary.get_formatted_annotations()
-                )  # noqa: E501
-                writer.writerow(
-                    {
-                        "Date": daily_report.get_formatted_date(),
-                        "Day": daily_report.get_day_name(),
-                        "Tag": tag_summary.tag,
-                        "Hours": f"{tag_summary.total_hours:.2f}",
-                        "Annotations": annotations,
-                    }
+            writer.writerows(
+                (
+                    date_str,
+                    day_name,
+                    tag_summary.tag,
+                    f"{tag_summary.total_hours:.2f}",
+                    "; ".join(tag_summary.formatted_annotations),
                 )
+                for tag_summary in sorted_tags
+            )
 
         return output.getvalue()
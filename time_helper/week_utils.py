@@ -1,7 +1,12 @@
 """Utilities for handling weeks and dates."""
 
 from datetime import date, timedelta
-from typing import List
+from typing import List, Optional
+
+# Offsets of each weekday from Monday, shared by every get_week_dates call
+_WEEK_OFFSETS = tuple(timedelta(days=i) for i in range(7))
+_ONE_WEEK = timedelta(weeks=1)
+_SIX_DAYS = timedelta(days=6)
 
 
 class WeekUtils:
@@ -10,42 +15,44 @@ class WeekUtils:
     @staticmethod
     def get_week_start(target_date: date) -> date:
         """Get the Monday of the week containing the target date."""
-        days_since_monday = target_date.weekday()
-        return target_date - timedelta(days=days_since_monday)
+        monday = target_date.toordinal() - target_date.weekday()
+        return date.fromordinal(monday)
 
     @staticmethod
     def get_week_dates(week_start: date) -> List[date]:
         """Get all 7 dates for a week starting from Monday."""
-        return [week_start + timedelta(days=i) for i in range(7)]
+        return [week_start + offset for offset in _WEEK_OFFSETS]
 
     @staticmethod
-    def get_week_start_date(week_offset: int, year: int) -> date:
-        """Get the start date of a week based on offset from current week."""
+    def get_week_start_date(
+        week_offset: int, year: Optional[int] = None
+    ) -> date:
+        """Get the start date of a week based on offset from current week.
+
+        Args:
+            week_offset: Weeks relative to the current week (negative for
+                past weeks)
+            year: Year to take the current ISO week number in; None or
+                the current year counts from today's week
+
+        Returns:
+            Monday of the target week
+        """
         today = date.today()
-        current_week_start = WeekUtils.get_week_start(today)
-        target_week_start = current_week_start + timedelta(weeks=week_offset)
-
-        # If year is specified and different from calculated year, adjust
-        if year != target_week_start.year:
-            # Find the first Monday of the specified year
-            jan_1 = date(year, 1, 1)
-            first_monday = WeekUtils.get_week_start(jan_1)
-            if first_monday.year < year:
-                first_monday += timedelta(weeks=1)
-
-            # Apply the same week offset from the first Monday of that year
-            current_week_number = (
-                current_week_start
-                - WeekUtils.get_week_start(date(today.year, 1, 1))  # noqa: E501
-            ).days // 7
-            target_week_start = first_monday + timedelta(
-                weeks=current_week_number + week_offset
-            )
-
-        return target_week_start
+
+        if year is None or year == today.year:
+            # Step whole weeks from the current week, across New Year too
+            current_week_start = WeekUtils.get_week_start(today)
+            return current_week_start + _ONE_WEEK * week_offset
+
+        # Same ISO week number in the requested year; weeks counted from
+        # its first ISO week so offsets past either end carry over into
+        # the neighbouring year
+        weeks_in = today.isocalendar().week - 1 + week_offset
+        return date.fromisocalendar(year, 1, 1) + _ONE_WEEK * weeks_in
 
     @staticmethod
     def format_week_range(week_start: date) -> str:
         """Format a week range string."""
-        week_end = week_start + timedelta(days=6)
+        week_end = week_start + _SIX_DAYS
         return f"{week_start.strftime('%Y-%m-%d')} to {week_end.strftime('%Y-%m-%d')}"  # noqa: E501